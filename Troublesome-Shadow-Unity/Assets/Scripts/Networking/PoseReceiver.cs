@@ -1,5 +1,7 @@
 using System;
 using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.IO;
 using System.Net.Sockets;
 using System.Net.WebSockets;
 using System.Text;
@@ -152,6 +154,7 @@ namespace PoseRuntime
                     Connected?.Invoke();
 
                     var buffer = new byte[65536];
+                    var message = new MemoryStream();
                     while (!token.IsCancellationRequested && _webSocket.State == WebSocketState.Open)
                     {
                         var result = await _webSocket.ReceiveAsync(new ArraySegment<byte>(buffer), token);
@@ -161,7 +164,15 @@ namespace PoseRuntime
                             break;
                         }
 
-                        var json = Encoding.UTF8.GetString(buffer, 0, result.Count);
+                        // Batched payloads can exceed the receive buffer; reassemble fragments before parsing.
+                        message.Write(buffer, 0, result.Count);
+                        if (!result.EndOfMessage)
+                        {
+                            continue;
+                        }
+
+                        var json = Encoding.UTF8.GetString(message.GetBuffer(), 0, (int)message.Length);
+                        message.SetLength(0);
                         EnqueueSample(json);
                     }
                 }
@@ -216,17 +227,21 @@ namespace PoseRuntime
         {
             try
             {
-                var sample = JsonConvert.DeserializeObject<SkeletonSample>(json, _serializerSettings);
-                if (sample != null)
+                // The capture app may coalesce frames into {"_frames": [...]}; the key always leads the payload.
+                if (json.StartsWith(BatchPrefix, StringComparison.Ordinal))
                 {
-                    _incoming.Enqueue(sample);
-                    Interlocked.Increment(ref _framesReceived);
-                    Interlocked.Exchange(ref _lastTimestampMs, sample._timestamp);
-                    if (_debugLogging && (_framesReceived % 30 == 1))
+                    var batch = JsonConvert.DeserializeObject<SkeletonBatch>(json, _serializerSettings);
+                    if (batch?._frames != null)
                     {
-                        Debug.Log($"PoseReceiver buffered frame {_framesReceived} (timestamp {sample._timestamp})");
+                        foreach (var frame in batch._frames)
+                        {
+                            BufferSample(frame);
+                        }
                     }
+                    return;
                 }
+
+                BufferSample(JsonConvert.DeserializeObject<SkeletonSample>(json, _serializerSettings));
             }
             catch (Exception ex)
             {
@@ -237,5 +252,28 @@ namespace PoseRuntime
                 }
             }
         }
+
+        private void BufferSample(SkeletonSample sample)
+        {
+            if (sample == null)
+            {
+                return;
+            }
+
+            _incoming.Enqueue(sample);
+            Interlocked.Increment(ref _framesReceived);
+            Interlocked.Exchange(ref _lastTimestampMs, sample._timestamp);
+            if (_debugLogging && (_framesReceived % 30 == 1))
+            {
+                Debug.Log($"PoseReceiver buffered frame {_framesReceived} (timestamp {sample._timestamp})");
+            }
+        }
+
+        private const string BatchPrefix = "{\"_frames\"";
+
+        private class SkeletonBatch
+        {
+            public List<SkeletonSample> _frames;
+        }
     }
 }
@@ -1,9 +1,30 @@
-"""Pose capture package."""
+"""Pose capture package.
 
-from .pose_capture_app import PoseCaptureApp, CaptureConfig
-from .providers import SkeletonData, MediaPipeSkeletonProvider, OpenPoseSkeletonProvider
-from .seating import SeatingLayout, SeatRegion
-from .transports import SkeletonTransport, WebSocketSkeletonTransport, UDPSkeletonTransport
+Public classes are imported lazily (PEP 562) so that light-weight consumers
+such as the GUI tools do not pay for MediaPipe/OpenCV imports up front.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - import for type hints only
+    from .pose_capture_app import PoseCaptureApp, CaptureConfig
+    from .providers import SkeletonData, MediaPipeSkeletonProvider, OpenPoseSkeletonProvider
+    from .seating import SeatingLayout, SeatRegion
+    from .transports import SkeletonTransport, WebSocketSkeletonTransport, UDPSkeletonTransport
+
+_LAZY_EXPORTS = {
+    "PoseCaptureApp": ".pose_capture_app",
+    "CaptureConfig": ".pose_capture_app",
+    "SkeletonData": ".providers",
+    "MediaPipeSkeletonProvider": ".providers",
+    "OpenPoseSkeletonProvider": ".providers",
+    "SeatingLayout": ".seating",
+    "SeatRegion": ".seating",
+    "SkeletonTransport": ".transports",
+    "WebSocketSkeletonTransport": ".transports",
+    "UDPSkeletonTransport": ".transports",
+}
 
 __all__ = [
     "PoseCaptureApp",
@@ -17,3 +38,16 @@ __all__ = [
     "WebSocketSkeletonTransport",
     "UDPSkeletonTransport",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,11 @@
 """Graphical helper utilities for configuring pose capture."""
 
+from importlib import import_module
+
 __all__ = ["seating_editor", "launcher"]
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f".{name}", __name__)
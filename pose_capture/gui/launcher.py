@@ -1,6 +1,7 @@
 """Graphical launcher for the pose capture app."""
 from __future__ import annotations
 import asyncio
+import concurrent.futures
 import logging
 import threading
 from dataclasses import dataclass
@@ -8,11 +9,13 @@ from pathlib import Path
 from tkinter import filedialog, messagebox
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
 
-from ..pose_capture_app import CaptureConfig, PoseCaptureApp, build_config_from_args, create_argument_parser
 from ..seating import SeatingLayout
-from .seating_editor import SeatingEditorApp
+
+if TYPE_CHECKING:  # pragma: no cover - import for type hints only
+    from ..pose_capture_app import CaptureConfig, PoseCaptureApp
+    from .seating_editor import SeatingEditorApp
 
 LOGGER = logging.getLogger(__name__)
 
@@ -38,14 +41,37 @@ class _LauncherArgs:
     preview_window: str = "MediaPipe Pose"
     mode: str = "shadow"
     live_seating_editor: bool = True
+    send_batch_size: int = 1
+    send_batch_max_ms: float = 0.0
+    emit_bytes: bool = False
+    binary_frames: bool = False
+    reuse_tagged_seating: bool = False
+
+
+def _log_stop_failure(future: "concurrent.futures.Future") -> None:  # pragma: no cover - defensive
+    if not future.cancelled() and future.exception() is not None:
+        LOGGER.error("Failed to stop capture cleanly: %s", future.exception(), exc_info=future.exception())
+
+
+def _log_layout_update_failure(future: "asyncio.Future | concurrent.futures.Future") -> None:
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:  # pragma: no cover - defensive guard
+        LOGGER.error("Failed to push seating layout update: %s", exc, exc_info=exc)
 
 
 class _CaptureWorker(threading.Thread):
-    """Background thread that runs the async capture loop."""
+    """Background thread that runs the async capture loop.
 
-    def __init__(self, config: CaptureConfig) -> None:
+    Only used when Tk cannot watch the asyncio selector directly (e.g. on
+    Windows, where ``createfilehandler`` is unavailable).
+    """
+
+    def __init__(self, config: CaptureConfig, on_done: Callable[[Optional[BaseException]], None]) -> None:
         super().__init__(daemon=True)
         self.config = config
+        self._on_done = on_done
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self._app: Optional[PoseCaptureApp] = None
         self.error: Optional[BaseException] = None
@@ -62,50 +88,188 @@ class _CaptureWorker(threading.Thread):
             if self.loop:
                 self.loop.close()
             self.loop = None
+            self._on_done(self.error)
 
     async def _run_app(self) -> None:
+        from ..pose_capture_app import PoseCaptureApp
+
         async with PoseCaptureApp(self.config) as app:
             self._app = app
             await app.run()
 
     def stop(self) -> None:  # pragma: no cover - threading coordination
-        if not self.loop:
+        """Ask the capture loop to stop; completion is reported through ``on_done``."""
+
+        loop = self.loop
+        if not loop or not self._app:
             return
-        if self._app:
-            future = asyncio.run_coroutine_threadsafe(self._app.stop(), self.loop)
-            try:
-                future.result(timeout=5)
-            except Exception as exc:  # pragma: no cover - defensive guard
-                LOGGER.exception("Failed to stop capture cleanly: %s", exc)
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._app.stop(), loop)
+        except RuntimeError:  # loop already closed: the worker is finishing on its own
+            return
+        future.add_done_callback(_log_stop_failure)
 
     def update_seating_layout(self, layout: Optional[SeatingLayout]) -> None:
         if not self.loop or not self._app:
             return
         future = asyncio.run_coroutine_threadsafe(self._app.update_seating_layout(layout), self.loop)
+        future.add_done_callback(_log_layout_update_failure)
+
+
+class _GuestLoopRunner:
+    """Run the capture coroutines on the Tk thread by pumping asyncio from Tk.
+
+    Tk watches the selector of a private event loop via ``createfilehandler``
+    and a timer tracking the loop's next scheduled callback.  Each wake-up runs
+    a single non-blocking iteration of the asyncio loop, so no extra thread or
+    cross-thread hand-off is required.
+    """
+
+    _IDLE_TICK_MS = 50
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        config: CaptureConfig,
+        on_done: Callable[[Optional[BaseException]], None],
+    ) -> None:
+        self.master = master
+        self.config = config
+        self._on_done = on_done
+        self.loop = asyncio.new_event_loop()
+        self._app: Optional[PoseCaptureApp] = None
+        self._task: Optional[asyncio.Task] = None
+        self._timer: Optional[str] = None
+        self._fd = self._selector_fileno(self.loop)
+        self._finished = False
+        self.error: Optional[BaseException] = None
+
+    @staticmethod
+    def _selector_fileno(loop: asyncio.AbstractEventLoop) -> int:
+        selector = getattr(loop, "_selector", None)
+        fileno = getattr(selector, "fileno", None)
+        if not callable(fileno):
+            return -1
         try:
-            future.result(timeout=5)
-        except Exception as exc:  # pragma: no cover - defensive guard
-            LOGGER.exception("Failed to push seating layout update: %s", exc)
+            return int(fileno())
+        except (OSError, ValueError):
+            return -1
+
+    @classmethod
+    def is_supported(cls, master: tk.Misc) -> bool:
+        if not hasattr(master.tk, "createfilehandler"):
+            return False
+        loop = asyncio.new_event_loop()
+        try:
+            return cls._selector_fileno(loop) >= 0
+        finally:
+            loop.close()
+
+    def start(self) -> None:
+        self._task = self.loop.create_task(self._run_app())
+        self._task.add_done_callback(self._on_task_done)
+        self.master.tk.createfilehandler(self._fd, tk.READABLE, self._pump)
+        self._schedule(0)
+
+    def is_alive(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _run_app(self) -> None:
+        from ..pose_capture_app import PoseCaptureApp
+
+        async with PoseCaptureApp(self.config) as app:
+            self._app = app
+            await app.run()
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled():
+            exc = task.exception()
+            if exc is not None:
+                self.error = exc
+                LOGGER.error("Capture loop terminated unexpectedly", exc_info=exc)
+        self._finished = True
+        self._on_done(self.error)
+
+    def _pump(self, *_args) -> None:
+        self._timer = None
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        if self._finished:
+            self._shutdown()
+        else:
+            self._schedule(self._next_delay_ms())
+
+    def _next_delay_ms(self) -> int:
+        if getattr(self.loop, "_ready", None):
+            return 0
+        scheduled = getattr(self.loop, "_scheduled", None)
+        if not scheduled:
+            return self._IDLE_TICK_MS
+        delay = scheduled[0].when() - self.loop.time()
+        return max(0, min(self._IDLE_TICK_MS, int(delay * 1000)))
+
+    def _schedule(self, delay_ms: int) -> None:
+        if self._timer is not None:
+            self.master.after_cancel(self._timer)
+        self._timer = self.master.after(delay_ms, self._pump)
+
+    def stop(self) -> None:
+        """Cancel the capture task; shutdown finishes in later pumps and is reported via ``on_done``."""
+
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            self._schedule(0)
+
+    def _shutdown(self) -> None:
+        if self._timer is not None:
+            self.master.after_cancel(self._timer)
+            self._timer = None
+        if self.loop.is_closed():
+            return
+        self.master.tk.deletefilehandler(self._fd)
+        self.loop.close()
+
+    def update_seating_layout(self, layout: Optional[SeatingLayout]) -> None:
+        if not self._app or self.loop.is_closed():
+            return
+        task = self.loop.create_task(self._app.update_seating_layout(layout))
+        task.add_done_callback(_log_layout_update_failure)
+        self._schedule(0)
 
 
 class PoseCaptureLauncherApp:
     """Tkinter UI for configuring and launching :mod:`pose_capture_app`."""
 
+    _LAYOUT_FLUSH_DELAY_MS = 30
+    _STOP_TIMEOUT_MS = 5000
+
     def __init__(self, master: tk.Tk) -> None:
         self.master = master
         self.master.title("Pose Capture Launcher")
         self.master.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        self._parser = create_argument_parser()
-        defaults = self._parser.parse_args([])
-        self.args = _LauncherArgs(**vars(defaults))
-        self._worker: Optional[_CaptureWorker] = None
+        self.args = _LauncherArgs()
+        self._worker: Optional[_CaptureWorker | _GuestLoopRunner] = None
         self._active_seating_layout: Optional[SeatingLayout] = None
         self._seating_editor_window: Optional[tk.Toplevel] = None
         self._seating_editor: Optional[SeatingEditorApp] = None
+        self._pending_layout: Optional[SeatingLayout] = None
+        self._layout_flush_scheduled = False
+        self._closing = False
 
         self._build_ui()
         self._sync_from_args()
+        # The CLI parser lives next to the MediaPipe/OpenCV imports; load it once the window is up.
+        self.master.after_idle(self._load_cli_defaults)
+
+    def _load_cli_defaults(self) -> None:
+        from ..pose_capture_app import create_argument_parser
+
+        defaults = create_argument_parser().parse_args([])
+        self.args = _LauncherArgs(**vars(defaults))
+        self._sync_from_args()
 
     def _build_ui(self) -> None:
         frame = tk.Frame(self.master, padx=12, pady=12)
@@ -204,6 +368,26 @@ class PoseCaptureLauncherApp:
 
         frame.columnconfigure(1, weight=1)
 
+        self._field_vars: Dict[str, tk.Variable] = {
+            "provider": self.provider_var,
+            "transport": self.transport_var,
+            "endpoint": self.endpoint_var,
+            "frame_interval": self.frame_interval_var,
+            "calibration": self.calibration_var,
+            "metadata": self.metadata_var,
+            "seating_config": self.seating_var,
+            "camera": self.camera_var,
+            "model_complexity": self.model_complexity_var,
+            "detection_confidence": self.detection_confidence_var,
+            "tracking_confidence": self.tracking_confidence_var,
+            "image_width": self.image_width_var,
+            "image_height": self.image_height_var,
+            "preview": self.preview_var,
+            "preview_window": self.preview_window_var,
+            "mode": self.mode_var,
+            "live_seating_editor": self.live_editor_var,
+        }
+
         button_frame = tk.Frame(self.master, padx=12, pady=12)
         button_frame.pack(fill=tk.X)
 
@@ -219,23 +403,14 @@ class PoseCaptureLauncherApp:
         tk.Label(self.master, textvariable=self.status, anchor=tk.W).pack(fill=tk.X, padx=12, pady=(0, 12))
 
     def _sync_from_args(self) -> None:
-        self.provider_var.set(self.args.provider)
-        self.transport_var.set(self.args.transport)
-        self.endpoint_var.set(self.args.endpoint)
-        self.frame_interval_var.set(self.args.frame_interval)
-        self.calibration_var.set(self._path_to_string(self.args.calibration))
-        self.metadata_var.set(self._path_to_string(self.args.metadata))
-        self.seating_var.set(self._path_to_string(self.args.seating_config))
-        self.camera_var.set(self.args.camera)
-        self.model_complexity_var.set(self.args.model_complexity)
-        self.detection_confidence_var.set(self.args.detection_confidence)
-        self.tracking_confidence_var.set(self.args.tracking_confidence)
-        self.image_width_var.set("" if self.args.image_width is None else str(self.args.image_width))
-        self.image_height_var.set("" if self.args.image_height is None else str(self.args.image_height))
-        self.preview_var.set(self.args.preview)
-        self.preview_window_var.set(self.args.preview_window)
-        self.mode_var.set(self.args.mode)
-        self.live_editor_var.set(self.args.live_seating_editor)
+        pairs: List[object] = []
+        for name, var in self._field_vars.items():
+            value = getattr(self.args, name)
+            if value is None or isinstance(value, Path):
+                value = self._path_to_string(value)
+            pairs.extend((str(var), value))
+        # A single Tcl dispatch updates every variable instead of one ``set`` per field.
+        self.master.tk.call("foreach", ("name", "value"), tuple(pairs), "set ::$name $value")
         if hasattr(self, "_update_live_editor_state"):
             self._update_live_editor_state()
 
@@ -245,24 +420,28 @@ class PoseCaptureLauncherApp:
             var.set(path)
 
     def _collect_args(self) -> _LauncherArgs:
+        casts: Dict[str, Callable[[str], object]] = {
+            "frame_interval": float,
+            "calibration": self._to_path,
+            "metadata": self._to_path,
+            "seating_config": self._to_path,
+            "camera": int,
+            "model_complexity": int,
+            "detection_confidence": float,
+            "tracking_confidence": float,
+            "image_width": self._to_optional_int,
+            "image_height": self._to_optional_int,
+            "preview": self.master.tk.getboolean,
+            "live_seating_editor": self.master.tk.getboolean,
+        }
+        var_names = tuple(str(var) for var in self._field_vars.values())
+        # A single Tcl dispatch reads every variable instead of one ``get`` per field.
+        values = self.master.tk.splitlist(self.master.tk.call("lmap", "name", var_names, "set ::$name"))
         args = _LauncherArgs()
-        args.provider = self.provider_var.get()
-        args.transport = self.transport_var.get()
-        args.endpoint = self.endpoint_var.get()
-        args.frame_interval = float(self.frame_interval_var.get())
-        args.calibration = self._to_path(self.calibration_var.get())
-        args.metadata = self._to_path(self.metadata_var.get())
-        args.seating_config = self._to_path(self.seating_var.get())
-        args.camera = int(self.camera_var.get())
-        args.model_complexity = int(self.model_complexity_var.get())
-        args.detection_confidence = float(self.detection_confidence_var.get())
-        args.tracking_confidence = float(self.tracking_confidence_var.get())
-        args.image_width = self._to_optional_int(self.image_width_var.get())
-        args.image_height = self._to_optional_int(self.image_height_var.get())
-        args.preview = self.preview_var.get()
-        args.preview_window = self.preview_window_var.get()
-        args.mode = self.mode_var.get()
-        args.live_seating_editor = self.live_editor_var.get()
+        for name, value in zip(self._field_vars, values):
+            value = str(value)
+            cast = casts.get(name)
+            setattr(args, name, cast(value) if cast else value)
         return args
 
     def _start_capture(self) -> None:
@@ -270,6 +449,8 @@ class PoseCaptureLauncherApp:
             messagebox.showinfo("実行中", "既にキャプチャが実行されています")
             return
         try:
+            from ..pose_capture_app import build_config_from_args
+
             args = self._collect_args()
             config = build_config_from_args(args)
             if self._active_seating_layout is not None:
@@ -278,22 +459,44 @@ class PoseCaptureLauncherApp:
             LOGGER.exception("Failed to start capture: %s", exc)
             messagebox.showerror("起動エラー", str(exc))
             return
-        self._worker = _CaptureWorker(config)
-        self._worker.start()
+        if self._seating_editor is not None:
+            # The editor keeps its snapshot stream open and capture needs exclusive access;
+            # the stream stops after at most one more frame read.
+            self._seating_editor.release_camera(wait=0.5)
+        worker: _CaptureWorker | _GuestLoopRunner
+
+        def on_done(error: Optional[BaseException]) -> None:
+            self._notify_worker_done(worker, error)
+
+        if _GuestLoopRunner.is_supported(self.master):
+            worker = _GuestLoopRunner(self.master, config, on_done)
+        else:
+            worker = _CaptureWorker(config, on_done)
+        self._worker = worker
+        worker.start()
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.status.set("キャプチャ実行中…")
-        self.master.after(500, self._poll_worker)
 
-    def _poll_worker(self) -> None:
-        if not self._worker:
-            return
-        if self._worker.is_alive():
-            self.master.after(500, self._poll_worker)
+    def _notify_worker_done(self, worker: _CaptureWorker | _GuestLoopRunner, error: Optional[BaseException]) -> None:
+        # May run on the capture thread; ``after`` hands the result back to Tk.
+        try:
+            self.master.after(0, lambda: self._finish_worker(worker, error))
+        except (RuntimeError, tk.TclError):  # pragma: no cover - Tk already torn down
+            pass
+
+    def _finish_worker(self, worker: _CaptureWorker | _GuestLoopRunner, error: Optional[BaseException]) -> None:
+        if worker is not self._worker:
             return
-        if self._worker.error:
-            messagebox.showerror("エラー", f"キャプチャが異常終了しました: {self._worker.error}")
         self._worker = None
+        if self._closing:
+            self.master.destroy()
+            return
+        if error:
+            messagebox.showerror("エラー", f"キャプチャが異常終了しました: {error}")
+        self._reset_capture_controls()
+
+    def _reset_capture_controls(self) -> None:
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.status.set("停止しました")
@@ -301,14 +504,20 @@ class PoseCaptureLauncherApp:
     def _stop_capture(self) -> None:
         if not self._worker:
             return
+        # Never wait here: the worker reports back through ``_finish_worker`` once it has shut down.
         self._worker.stop()
-        self._worker.join(timeout=5)
-        if self._worker.is_alive():  # pragma: no cover - defensive guard
-            messagebox.showwarning("警告", "完全に停止できませんでした。アプリを再起動してください。")
-        self._worker = None
-        self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
-        self.status.set("停止しました")
+        self.status.set("停止しています…")
+        self.master.after(self._STOP_TIMEOUT_MS, self._check_stopped, self._worker)
+
+    def _check_stopped(self, worker: _CaptureWorker | _GuestLoopRunner) -> None:
+        if worker is not self._worker:
+            return
+        LOGGER.warning("Capture did not stop within %d ms", self._STOP_TIMEOUT_MS)
+        if self._closing:
+            self.master.destroy()
+            return
+        messagebox.showwarning("警告", "完全に停止できませんでした。アプリを再起動してください。")
 
     def _open_seating_editor(self) -> None:
         if self._seating_editor_window and self._seating_editor_window.winfo_exists():
@@ -327,6 +536,8 @@ class PoseCaptureLauncherApp:
                     LOGGER.error("Failed to load seating layout from %s: %s", path, exc)
                     messagebox.showerror("読み込みエラー", f"座席レイアウトを読み込めませんでした: {exc}")
 
+        from .seating_editor import SeatingEditorApp
+
         window = tk.Toplevel(self.master)
         window.title("座席レイアウトの編集")
 
@@ -344,8 +555,14 @@ class PoseCaptureLauncherApp:
         self._seating_editor = editor
 
     def _on_close(self) -> None:
+        if self._seating_editor is not None:
+            self._seating_editor.release_camera(wait=0.5)
+        if not self._worker:
+            self.master.destroy()
+            return
+        # Let the provider release the camera first; ``_finish_worker`` destroys the window.
+        self._closing = True
         self._stop_capture()
-        self.master.destroy()
 
     def _handle_layout_update(self, layout: Optional[SeatingLayout]) -> None:
         self._active_seating_layout = layout
@@ -354,6 +571,17 @@ class PoseCaptureLauncherApp:
             self.status.set(f"座席レイアウトを更新 ({seats}席)")
         else:
             self.status.set("座席レイアウトを無効化しました")
+        self._pending_layout = layout
+        if not self._layout_flush_scheduled:
+            self._layout_flush_scheduled = True
+            self.master.after(self._LAYOUT_FLUSH_DELAY_MS, self._flush_layout)
+
+    def _flush_layout(self) -> None:
+        """Forward only the most recent layout to the running capture loop."""
+
+        self._layout_flush_scheduled = False
+        layout = self._pending_layout
+        self._pending_layout = None
         if self._worker:
             self._worker.update_seating_layout(layout)
 
@@ -1,7 +1,6 @@
 """Interactive tool for authoring seating layout JSON files."""
 from __future__ import annotations
 
-import base64
 import json
 import logging
 import threading
@@ -14,6 +13,21 @@ try:  # pragma: no cover - optional dependency for camera capture
 except Exception:  # pragma: no cover - allow running without OpenCV
     cv2 = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency for vectorised redraws
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - fall back to per-seat arithmetic
+    np = None  # type: ignore
+
+try:  # pragma: no cover - optional decoder for JPEG and large backgrounds
+    from PIL import Image  # type: ignore
+except ImportError:  # pragma: no cover - fall back to Tk's built-in image formats
+    Image = None  # type: ignore
+
+try:  # pragma: no cover - optional faster JSON encoder
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None  # type: ignore
+
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
 
@@ -22,7 +36,7 @@ from ..seating import SeatRegion, SeatingLayout
 LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SeatDraft:
     """Represents a seat bounding box while editing."""
 
@@ -53,9 +67,78 @@ class SeatDraft:
         }
 
 
+class _CameraStream:
+    """Opens a camera on a daemon thread and hands out frames to queued requests.
+
+    The device stays open until :meth:`close` so repeated captures skip the cold
+    open; between requests frames are only grabbed, not decoded. Owners must
+    close the stream before other code (e.g. the capture launcher) opens the camera.
+    """
+
+    def __init__(self, camera_index: int, callback: Callable[[object, Optional[str]], None]) -> None:
+        self._camera_index = camera_index
+        self._lock = threading.Lock()
+        self._requests: List[Callable[[object, Optional[str]], None]] = [callback]
+        self._closed = False
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def request_frame(self, callback: Callable[[object, Optional[str]], None]) -> bool:
+        """Queue ``callback`` for the next frame; ``False`` if the stream has ended."""
+
+        with self._lock:
+            if self._closed:
+                return False
+            self._requests.append(callback)
+            return True
+
+    def close(self, wait: float = 0.0) -> None:
+        """Stop the stream; ``wait`` bounds how long to wait for the device to be released."""
+
+        self._stop_event.set()
+        if wait > 0:
+            self._thread.join(wait)
+
+    def _take_requests(self, *, closing: bool = False) -> List[Callable[[object, Optional[str]], None]]:
+        with self._lock:
+            requests, self._requests = self._requests, []
+            self._closed = self._closed or closing
+        return requests
+
+    def _run(self) -> None:  # pragma: no cover - requires camera input
+        capture = cv2.VideoCapture(self._camera_index)
+        error: Optional[str] = None
+        try:
+            if not capture.isOpened():
+                error = "カメラを初期化できませんでした"
+                return
+            while not self._stop_event.is_set():
+                with self._lock:
+                    idle = not self._requests
+                if idle:
+                    # Keep draining the driver buffer so the next request gets a fresh frame.
+                    if not capture.grab():
+                        error = "フレームを取得できませんでした"
+                        return
+                    continue
+                ret, frame = capture.read()
+                if not ret:
+                    error = "フレームを取得できませんでした"
+                    return
+                for callback in self._take_requests():
+                    callback(frame, None)
+        finally:
+            capture.release()
+            for callback in self._take_requests(closing=True):
+                callback(None, error or "カメラが停止しました")
+
+
 class SeatingEditorApp:
     """Tkinter-based editor for configuring seating layouts."""
 
+    _MOTION_INTERVAL_MS = 16
+
     def __init__(
         self,
         master: tk.Tk,
@@ -71,16 +154,24 @@ class SeatingEditorApp:
         self.master.protocol("WM_DELETE_WINDOW", self._handle_close)
 
         self._background_image: Optional[tk.PhotoImage] = None
+        self._background_item: Optional[int] = None
+        self._camera: Optional[_CameraStream] = None
+        self._rgb_buffer = None  # reused BGR->RGB conversion target, only touched on the camera thread
         self._image_width = 1
         self._image_height = 1
 
         self._seats: List[SeatDraft] = []
+        self._seat_index: Dict[str, int] = {}
+        self._seat_bounds_norm = None  # (N, 4) array mirroring ``self._seats`` when NumPy is available
         self._seat_rectangles: Dict[str, int] = {}
         self._seat_labels: Dict[str, int] = {}
+        self._highlighted_rect: Optional[int] = None
         self._current_action: Optional[str] = None
         self._start_x = 0
         self._start_y = 0
         self._draft_rectangle: Optional[int] = None
+        self._pending_xy: Optional[tuple[int, int]] = None
+        self._pending_motion: Optional[str] = None
 
         self._build_ui()
         if initial_layout:
@@ -134,51 +225,81 @@ class SeatingEditorApp:
             return
         path = Path(path_str)
         try:
-            image = tk.PhotoImage(file=str(path))
+            image = self._read_background(path)
         except Exception as exc:  # pragma: no cover - Tk image errors
             messagebox.showerror("読み込みエラー", f"画像を読み込めませんでした: {exc}")
             return
         self._set_background_image(image)
         self.status.set(f"背景画像: {path.name}")
 
+    def _read_background(self, path: Path) -> tk.PhotoImage:
+        if Image is None:
+            return tk.PhotoImage(file=str(path))
+        # Pillow's codecs are much faster than Tk's and also cover JPEG; hand Tk raw PPM pixels.
+        with Image.open(path) as source:
+            rgb = source.convert("RGB")
+        width, height = rgb.size
+        return tk.PhotoImage(data=self._ppm_bytes(width, height, rgb.tobytes()), format="PPM")
+
     def _capture_frame(self) -> None:
         if cv2 is None:
             messagebox.showwarning("カメラ未対応", "OpenCV が見つからなかったため、カメラ取得は利用できません。")
             return
-        capture = cv2.VideoCapture(0)
-        if not capture.isOpened():
-            messagebox.showerror("カメラエラー", "カメラを初期化できませんでした")
-            return
+        if self._camera is None or not self._camera.request_frame(self._on_camera_frame):
+            self._camera = _CameraStream(0, self._on_camera_frame)
+        self.status.set("カメラからフレームを取得しています…")
 
-        def _worker() -> None:
+    def _on_camera_frame(self, frame, error: Optional[str]) -> None:
+        """Runs on the camera thread once the next frame (or an error) is available."""
+
+        try:
+            if error:
+                raise RuntimeError(error)
+            if self._rgb_buffer is None or self._rgb_buffer.shape != frame.shape:
+                self._rgb_buffer = frame.copy()
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+            height, width = rgb.shape[:2]
+            # join() in _ppm_bytes copies straight from the array buffer, no intermediate tobytes().
+            data = self._ppm_bytes(width, height, rgb.data)
+        except Exception as exc:
+            LOGGER.exception("Failed to capture frame: %s", exc)
+            self.master.after(0, lambda: messagebox.showerror("カメラエラー", str(exc)))
+        else:
+            self.master.after(0, lambda: self._show_camera_frame(data, width, height))
+
+    def _show_camera_frame(self, data: bytes, width: int, height: int) -> None:
+        image = self._background_image
+        if image is not None and image.width() == width and image.height() == height:
+            # Same geometry: overwrite the existing photo in place so the canvas item,
+            # the seat overlays and their coordinates are all left untouched.
+            image.tk.call(image.name, "put", data, "-format", "ppm")
+        else:
             try:
-                ret, frame = capture.read()
-                if not ret:
-                    raise RuntimeError("フレームを取得できませんでした")
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                success, encoded = cv2.imencode(".png", rgb)
-                if not success:
-                    raise RuntimeError("フレームのエンコードに失敗しました")
-                data = base64.b64encode(encoded.tobytes()).decode("ascii")
-                image = tk.PhotoImage(data=data, format="png")
-            except Exception as exc:
-                LOGGER.exception("Failed to capture frame: %s", exc)
-                self.master.after(0, lambda: messagebox.showerror("カメラエラー", str(exc)))
-            else:
-                self.master.after(0, lambda: self._set_background_image(image))
-                self.master.after(0, lambda: self.status.set("カメラからフレームを取得しました"))
-            finally:
-                capture.release()
+                image = tk.PhotoImage(data=data, format="PPM")
+            except tk.TclError as exc:  # pragma: no cover - Tk image errors
+                messagebox.showerror("カメラエラー", str(exc))
+                return
+            self._set_background_image(image)
+        self.status.set("カメラからフレームを取得しました")
 
-        threading.Thread(target=_worker, daemon=True).start()
+    @staticmethod
+    def _ppm_bytes(width: int, height: int, pixels) -> bytes:
+        """Wrap raw RGB pixels in a binary PPM header Tk can decode without compression."""
+
+        return b"".join((f"P6\n{width} {height}\n255\n".encode("ascii"), pixels))
 
     def _set_background_image(self, image: tk.PhotoImage) -> None:
+        previous = self._background_image  # keep the old photo alive until the item is repointed
         self._background_image = image
         self._image_width = max(1, image.width())
         self._image_height = max(1, image.height())
-        self.canvas.delete("all")
         self.canvas.config(width=self._image_width, height=self._image_height)
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self._background_image, tags="background")
+        if self._background_item is None:
+            self._background_item = self.canvas.create_image(0, 0, anchor=tk.NW, image=image, tags="background")
+            self.canvas.tag_lower(self._background_item)
+        else:
+            self.canvas.itemconfig(self._background_item, image=image)
+        del previous
         self._redraw_all_seats()
 
     # ------------------------------------------------------------------
@@ -199,16 +320,19 @@ class SeatingEditorApp:
         new_id = simpledialog.askstring("座席名", "新しい座席IDを入力", initialvalue=seat.seat_id)
         if not new_id:
             return
-        if any(existing.seat_id == new_id for existing in self._seats if existing is not seat):
+        if self._seat_index.get(new_id, index) != index:
             messagebox.showerror("重複", "同じIDの座席が既に存在します")
             return
         old_id = seat.seat_id
-        seat.seat_id = new_id
-        self._seat_rectangles.pop(old_id, None)
+        self._rename_seat_id(index, new_id)
+        rect_id = self._seat_rectangles.pop(old_id, None)
         label_id = self._seat_labels.pop(old_id, None)
-        if label_id:
-            self.canvas.delete(label_id)
-        self._draw_and_track(seat)
+        if rect_id and label_id:
+            self._seat_rectangles[new_id] = rect_id
+            self._seat_labels[new_id] = label_id
+            self.canvas.itemconfig(label_id, text=new_id)
+        else:
+            self._draw_and_track(seat)
         self._refresh_list()
         self._notify_layout_change()
 
@@ -216,9 +340,11 @@ class SeatingEditorApp:
         index = self._get_selected_index()
         if index is None:
             return
-        seat = self._seats.pop(index)
+        seat = self._remove_seat(index)
         rect_id = self._seat_rectangles.pop(seat.seat_id, None)
         if rect_id:
+            if rect_id == self._highlighted_rect:
+                self._highlighted_rect = None
             self.canvas.delete(rect_id)
         label_id = self._seat_labels.pop(seat.seat_id, None)
         if label_id:
@@ -227,6 +353,31 @@ class SeatingEditorApp:
         self.status.set(f"座席 {seat.seat_id} を削除しました")
         self._notify_layout_change()
 
+    def _add_seat(self, seat: SeatDraft) -> None:
+        self._seat_index[seat.seat_id] = len(self._seats)
+        self._seats.append(seat)
+        self._sync_seat_bounds()
+
+    def _remove_seat(self, index: int) -> SeatDraft:
+        seat = self._seats.pop(index)
+        del self._seat_index[seat.seat_id]
+        for position in range(index, len(self._seats)):
+            self._seat_index[self._seats[position].seat_id] = position
+        self._sync_seat_bounds()
+        return seat
+
+    def _rename_seat_id(self, index: int, new_id: str) -> None:
+        seat = self._seats[index]
+        del self._seat_index[seat.seat_id]
+        seat.seat_id = new_id
+        self._seat_index[new_id] = index
+
+    def _replace_seats(self, seats: List[SeatDraft]) -> None:
+        self._clear_highlight()
+        self._seats = seats
+        self._seat_index = {seat.seat_id: position for position, seat in enumerate(seats)}
+        self._sync_seat_bounds()
+
     def _get_selected_index(self) -> Optional[int]:
         selection = self.seat_list.curselection()
         if not selection:
@@ -234,9 +385,15 @@ class SeatingEditorApp:
             return None
         return selection[0]
 
+    def _clear_highlight(self) -> None:
+        # Only the previously highlighted rectangle needs resetting; itemconfig on a
+        # since-deleted item id matches nothing and is a no-op in Tk.
+        if self._highlighted_rect is not None:
+            self.canvas.itemconfig(self._highlighted_rect, width=2)
+            self._highlighted_rect = None
+
     def _highlight_selected(self) -> None:
-        for rect_id in self._seat_rectangles.values():
-            self.canvas.itemconfig(rect_id, width=2)
+        self._clear_highlight()
         index = self.seat_list.curselection()
         if not index:
             return
@@ -244,6 +401,7 @@ class SeatingEditorApp:
         rect_id = self._seat_rectangles.get(seat.seat_id)
         if rect_id:
             self.canvas.itemconfig(rect_id, width=4)
+            self._highlighted_rect = rect_id
 
     def _draw_and_track(self, seat: SeatDraft) -> None:
         rect_id, label_id = self._draw_seat(seat)
@@ -258,6 +416,20 @@ class SeatingEditorApp:
         label_id = self.canvas.create_text(label_x, label_y, text=seat.seat_id, fill="#00ff88")
         return rect_id, label_id
 
+    def _draw_seat_fast(self, seat: SeatDraft, coords: List[float]) -> tuple[int, int]:
+        """Same as :meth:`_draw_seat` but dispatches straight to Tcl.
+
+        Skips the ``_flatten``/option handling of the ``create_*`` wrappers,
+        which dominates redraw time for layouts with many seats.
+        """
+
+        x0, y0, x1, y1 = coords
+        call = self.canvas.tk.call
+        widget = str(self.canvas)
+        rect_id = call(widget, "create", "rectangle", x0, y0, x1, y1, "-outline", "#00ff88", "-width", 2, "-tags", "seat")
+        label_id = call(widget, "create", "text", (x0 + x1) / 2, (y0 + y1) / 2, "-text", seat.seat_id, "-fill", "#00ff88")
+        return int(rect_id), int(label_id)
+
     # ------------------------------------------------------------------
     # Canvas interactions
     # ------------------------------------------------------------------
@@ -272,21 +444,38 @@ class SeatingEditorApp:
     def _on_canvas_drag(self, event: tk.Event) -> None:
         if self._current_action != "draw":
             return
+        # Coalesce motion events so the rubber band is updated at most once per display frame.
+        self._pending_xy = (event.x, event.y)
+        if self._pending_motion is None:
+            self._pending_motion = self.master.after(self._MOTION_INTERVAL_MS, self._apply_pending_motion)
+
+    def _apply_pending_motion(self) -> None:
+        self._pending_motion = None
+        if self._pending_xy is None:
+            return
+        x, y = self._pending_xy
+        self._pending_xy = None
         if self._draft_rectangle is None:
             self._draft_rectangle = self.canvas.create_rectangle(
                 self._start_x,
                 self._start_y,
-                event.x,
-                event.y,
+                x,
+                y,
                 outline="#ffaa00",
                 dash=(4, 2),
             )
         else:
-            self.canvas.coords(self._draft_rectangle, self._start_x, self._start_y, event.x, event.y)
+            self.canvas.coords(self._draft_rectangle, self._start_x, self._start_y, x, y)
+
+    def _flush_pending_motion(self) -> None:
+        if self._pending_motion is not None:
+            self.master.after_cancel(self._pending_motion)
+            self._apply_pending_motion()
 
     def _on_canvas_release(self, event: tk.Event) -> None:
         if self._current_action != "draw":
             return
+        self._flush_pending_motion()
         if self._draft_rectangle is None:
             return
         x0, y0, x1, y1 = self.canvas.coords(self._draft_rectangle)
@@ -301,7 +490,7 @@ class SeatingEditorApp:
         if not seat_id:
             self.status.set("座席IDが入力されませんでした")
             return
-        if any(existing.seat_id == seat_id for existing in self._seats):
+        if seat_id in self._seat_index:
             messagebox.showerror("重複", "同じIDの座席が既に存在します")
             return
 
@@ -312,7 +501,7 @@ class SeatingEditorApp:
             x_max=self._clamp(max(x0, x1) / self._image_width),
             y_max=self._clamp(max(y0, y1) / self._image_height),
         )
-        self._seats.append(seat)
+        self._add_seat(seat)
         self._draw_and_track(seat)
         self._refresh_list()
         self.status.set(f"座席 {seat_id} を追加しました")
@@ -334,16 +523,18 @@ class SeatingEditorApp:
         except Exception as exc:  # pragma: no cover - parsing guard
             messagebox.showerror("読み込みエラー", f"レイアウトを読み込めませんでした: {exc}")
             return
-        self._seats = [
-            SeatDraft(
-                seat_id=seat.seat_id,
-                x_min=seat.x_min,
-                y_min=seat.y_min,
-                x_max=seat.x_max,
-                y_max=seat.y_max,
-            )
-            for seat in layout.seats
-        ]
+        self._replace_seats(
+            [
+                SeatDraft(
+                    seat_id=seat.seat_id,
+                    x_min=seat.x_min,
+                    y_min=seat.y_min,
+                    x_max=seat.x_max,
+                    y_max=seat.y_max,
+                )
+                for seat in layout.seats
+            ]
+        )
         self._refresh_list()
         self._redraw_all_seats()
         self.status.set(f"{path.name} を読み込みました")
@@ -361,9 +552,20 @@ class SeatingEditorApp:
         if not path_str:
             return
         path = Path(path_str)
-        payload = {"seats": [seat.to_payload() for seat in self._seats]}
+        payload = {
+            "seats": [
+                {
+                    "id": seat.seat_id,
+                    "bounds": {"xMin": seat.x_min, "xMax": seat.x_max, "yMin": seat.y_min, "yMax": seat.y_max},
+                }
+                for seat in self._seats
+            ]
+        }
         try:
-            path.write_text(json.dumps(payload, indent=2))
+            if orjson is not None:
+                path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            else:
+                path.write_text(json.dumps(payload, indent=2))
         except Exception as exc:  # pragma: no cover - IO errors
             messagebox.showerror("保存エラー", f"レイアウトを書き出せませんでした: {exc}")
             return
@@ -380,16 +582,47 @@ class SeatingEditorApp:
             seat.y_max * self._image_height,
         ]
 
+    def _sync_seat_bounds(self) -> None:
+        if np is None:
+            return
+        self._seat_bounds_norm = np.array(
+            [(seat.x_min, seat.y_min, seat.x_max, seat.y_max) for seat in self._seats], dtype=np.float64
+        ).reshape(-1, 4)
+
+    def _all_seats_to_canvas(self) -> List[List[float]]:
+        bounds = self._seat_bounds_norm
+        if bounds is None or len(bounds) != len(self._seats):
+            return [self._seat_to_canvas(seat) for seat in self._seats]
+        scale = np.array([self._image_width, self._image_height, self._image_width, self._image_height], dtype=np.float64)
+        return (bounds * scale).tolist()
+
     def _redraw_all_seats(self) -> None:
-        self.canvas.delete("seat")
-        for label_id in self._seat_labels.values():
-            self.canvas.delete(label_id)
-        self._seat_rectangles.clear()
-        self._seat_labels.clear()
-        for seat in self._seats:
-            self._draw_and_track(seat)
+        """Sync canvas items with ``self._seats``, moving existing items in place."""
+
+        current_ids = {seat.seat_id for seat in self._seats}
+        for seat_id in [seat_id for seat_id in self._seat_rectangles if seat_id not in current_ids]:
+            rect_id = self._seat_rectangles.pop(seat_id)
+            if rect_id == self._highlighted_rect:
+                self._highlighted_rect = None
+            self.canvas.delete(rect_id)
+            label_id = self._seat_labels.pop(seat_id, None)
+            if label_id:
+                self.canvas.delete(label_id)
+        for seat, coords in zip(self._seats, self._all_seats_to_canvas()):
+            rect_id = self._seat_rectangles.get(seat.seat_id)
+            label_id = self._seat_labels.get(seat.seat_id)
+            if rect_id is None or label_id is None:
+                rect_id, label_id = self._draw_seat_fast(seat, coords)
+                self._seat_rectangles[seat.seat_id] = rect_id
+                self._seat_labels[seat.seat_id] = label_id
+                continue
+            x0, y0, x1, y1 = coords
+            self.canvas.coords(rect_id, x0, y0, x1, y1)
+            self.canvas.coords(label_id, (x0 + x1) / 2, (y0 + y1) / 2)
 
     def _refresh_list(self) -> None:
+        # Rebuilding the listbox drops its selection, so drop the canvas highlight with it.
+        self._clear_highlight()
         self.seat_list.delete(0, tk.END)
         for seat in self._seats:
             bounds = f"({seat.x_min:.2f}, {seat.y_min:.2f})-({seat.x_max:.2f}, {seat.y_max:.2f})"
@@ -419,11 +652,9 @@ class SeatingEditorApp:
     def set_layout(self, layout: Optional[SeatingLayout]) -> None:
         """Replace the editable seats with a new layout."""
 
-        self._seats = []
-        self._seat_rectangles.clear()
-        self._seat_labels.clear()
+        seats: List[SeatDraft] = []
         if layout:
-            self._seats = [
+            seats = [
                 SeatDraft(
                     seat_id=seat.seat_id,
                     x_min=seat.x_min,
@@ -433,11 +664,20 @@ class SeatingEditorApp:
                 )
                 for seat in layout.seats
             ]
+        self._replace_seats(seats)
         self._refresh_list()
         self._redraw_all_seats()
         self._notify_layout_change()
 
+    def release_camera(self, wait: float = 0.0) -> None:
+        """Close the warm camera stream so the device is free for other users."""
+
+        if self._camera is not None:
+            self._camera.close(wait)
+            self._camera = None
+
     def _handle_close(self) -> None:
+        self.release_camera()
         if self._on_close_callback:
             try:
                 self._on_close_callback()
@@ -2,20 +2,26 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 try:  # pragma: no cover - optional dependency guarded at runtime
     import cv2  # type: ignore
 except Exception:  # pragma: no cover - allow import without OpenCV for tests
     cv2 = None  # type: ignore
 
+try:  # pragma: no cover - NumPy ships with OpenCV but keep the import optional
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - scalar fallbacks are used instead
+    np = None  # type: ignore
+
 from .seating import SeatRegion, SeatingLayout
 
 LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class _SeatDraft:
     """Editable representation of a single seat."""
 
@@ -40,6 +46,9 @@ class LiveSeatingEditor:
 
     _HANDLE_RADIUS = 12
     _MIN_EXTENT = 0.02
+    _VECTOR_PICK_MIN_SEATS = 4
+    _DRAG_UPDATE_INTERVAL = 1 / 60
+    _EMIT_INTERVAL = 0.05
 
     def __init__(
         self,
@@ -52,9 +61,14 @@ class LiveSeatingEditor:
         self.window_name = window_name
         self._on_layout_changed = on_layout_changed
         self._seats: List[_SeatDraft] = []
+        self._seat_index: Dict[str, int] = {}
         self._selected_index: Optional[int] = None
         self._frame_width: int = 1
         self._frame_height: int = 1
+        self._inv_width = 1.0  # cached 1 / frame size for the per-motion pixel -> normalized conversion
+        self._inv_height = 1.0
+        self._seat_pixels_cache = None  # (N, 4) int32 pixel bounds, rebuilt lazily
+        self._seat_polygons_cache = None  # (N, 4, 2) int32 outlines derived from the pixel bounds
         self._editing_enabled = False
         self._pending_create = False
         self._drag_state: Optional[str] = None
@@ -65,6 +79,12 @@ class LiveSeatingEditor:
         self._status_message = "'E'キーで編集モード"
         self._mouse_attached = False
         self._last_mouse_position: Tuple[int, int] = (0, 0)
+        self._last_drag_update = 0.0
+        self._info_overlay = None  # pre-rendered help/status text, see _draw_info
+        self._info_overlay_lines: Tuple[str, ...] = ()
+        self._layout_cache: Optional[SeatingLayout] = None  # rebuilt only after the seats change
+        self._last_emit = 0.0
+        self._emit_pending = False
 
     # ------------------------------------------------------------------
     # Public API
@@ -83,10 +103,10 @@ class LiveSeatingEditor:
         self._on_layout_changed = callback
 
     def set_layout(self, layout: Optional[SeatingLayout]) -> None:
-        self._seats.clear()
+        self._clear_seats()
         if layout:
             for seat in layout.seats:
-                self._seats.append(
+                self._add_seat(
                     _SeatDraft(
                         seat_id=seat.seat_id,
                         x_min=seat.x_min,
@@ -98,25 +118,87 @@ class LiveSeatingEditor:
         self._selected_index = 0 if self._seats else None
 
     def render(self, frame) -> None:
-        self._frame_height, self._frame_width = frame.shape[:2]
-        for index, seat in enumerate(self._seats):
-            color = (0, 200, 255) if index == self._selected_index and self._editing_enabled else (0, 160, 64)
-            x1, y1, x2, y2 = self._seat_pixels(seat)
-            cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
-            label = f"{seat.seat_id}"
-            cv2.putText(frame, label, (x1 + 4, y1 + 18), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1, cv2.LINE_AA)
-            if self._editing_enabled and index == self._selected_index:
+        frame_height, frame_width = frame.shape[:2]
+        if (frame_width, frame_height) != (self._frame_width, self._frame_height):
+            self._frame_height, self._frame_width = frame_height, frame_width
+            self._inv_width = 1.0 / max(1, frame_width)
+            self._inv_height = 1.0 / max(1, frame_height)
+            self._invalidate_seat_pixels()
+        if self._emit_pending and time.monotonic() - self._last_emit >= self._EMIT_INTERVAL:
+            self._emit_layout()
+        if np is None:
+            for index, seat in enumerate(self._seats):
+                color = (0, 200, 255) if index == self._selected_index and self._editing_enabled else (0, 160, 64)
+                x1, y1, x2, y2 = self._seat_pixels(seat)
+                cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
+                label = f"{seat.seat_id}"
+                cv2.putText(frame, label, (x1 + 4, y1 + 18), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1, cv2.LINE_AA)
+                if self._editing_enabled and index == self._selected_index:
+                    self._draw_handles(frame, x1, y1, x2, y2)
+        else:
+            self._draw_seats_batched(frame)
+        self._draw_info(frame)
+        if self._pending_create and self._create_start_px:
+            x1, y1 = self._create_start_px
+            x2, y2 = self._last_mouse_position
+            cv2.rectangle(frame, (x1, y1), (x2, y2), (200, 200, 200), 1, cv2.LINE_AA)
+
+    def _draw_seats_batched(self, frame) -> None:
+        if not self._seats:
+            return
+        pixels = self._seat_pixel_array()
+        polygons = self._seat_polygon_array()
+        highlighted = self._selected_index if self._editing_enabled else None
+        others = polygons if highlighted is None else np.delete(polygons, highlighted, axis=0)
+        if len(others):
+            # Unselected seats share one colour, so all outlines go through a single OpenCV call.
+            cv2.polylines(frame, others, True, (0, 160, 64), 2)
+        for index, (seat, (x1, y1, x2, y2)) in enumerate(zip(self._seats, pixels.tolist())):
+            color = (0, 160, 64)
+            if index == highlighted:
+                color = (0, 200, 255)
+                cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
                 self._draw_handles(frame, x1, y1, x2, y2)
+            cv2.putText(frame, seat.seat_id, (x1 + 4, y1 + 18), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1, cv2.LINE_AA)
+
+    def _info_lines(self) -> Tuple[str, ...]:
         if self._editing_enabled:
-            info_lines = [
+            return (
                 "編集モード: 座席をドラッグで移動 / 角をドラッグでリサイズ",
                 "Tab: 次の座席 / Delete: 削除 / N: 追加 / C: すべて削除 / E: 終了",
-            ]
-        else:
-            info_lines = [self._status_message]
+            )
+        return (self._status_message,)
+
+    def _draw_info(self, frame) -> None:
+        info_lines = self._info_lines()
+        if np is None:
+            self._put_info_lines(frame, info_lines)
+            return
+        if info_lines != self._info_overlay_lines:
+            self._rebuild_info_overlay(info_lines)
+        overlay = self._info_overlay
+        height = min(overlay.shape[0], frame.shape[0])
+        width = min(overlay.shape[1], frame.shape[1])
+        region = frame[:height, :width]
+        # White anti-aliased text on black: a per-pixel max composites it without re-rasterising glyphs.
+        cv2.max(region, overlay[:height, :width], dst=region)
+
+    def _rebuild_info_overlay(self, info_lines: Tuple[str, ...]) -> None:
+        width = 1
+        for text in info_lines:
+            (text_width, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+            width = max(width, 10 + text_width + 2)
+        height = 24 + (len(info_lines) - 1) * 20 + 8
+        overlay = np.zeros((height, width, 3), dtype=np.uint8)
+        self._put_info_lines(overlay, info_lines)
+        self._info_overlay = overlay
+        self._info_overlay_lines = info_lines
+
+    @staticmethod
+    def _put_info_lines(image, info_lines: Tuple[str, ...]) -> None:
         for idx, text in enumerate(info_lines):
             cv2.putText(
-                frame,
+                image,
                 text,
                 (10, 24 + idx * 20),
                 cv2.FONT_HERSHEY_SIMPLEX,
@@ -125,10 +207,6 @@ class LiveSeatingEditor:
                 1,
                 cv2.LINE_AA,
             )
-        if self._pending_create and self._create_start_px:
-            x1, y1 = self._create_start_px
-            x2, y2 = self._last_mouse_position
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (200, 200, 200), 1, cv2.LINE_AA)
 
     def handle_key(self, key: int) -> None:
         if key < 0:
@@ -160,7 +238,11 @@ class LiveSeatingEditor:
         if event == cv2.EVENT_LBUTTONDOWN:
             self._start_drag(x, y)
         elif event == cv2.EVENT_MOUSEMOVE and self._drag_state:
-            self._update_drag(x, y)
+            # Mice can report hundreds of moves per second; the preview only repaints once per frame.
+            now = time.monotonic()
+            if now - self._last_drag_update >= self._DRAG_UPDATE_INTERVAL:
+                self._last_drag_update = now
+                self._update_drag(x, y)
         elif event == cv2.EVENT_LBUTTONUP and self._drag_state:
             self._finish_drag(x, y)
 
@@ -200,8 +282,8 @@ class LiveSeatingEditor:
             return
         seat = self._seats[self._selected_index]
         if self._drag_state == "move":
-            dx = (x - self._drag_start_px[0]) / max(1, self._frame_width)
-            dy = (y - self._drag_start_px[1]) / max(1, self._frame_height)
+            dx = (x - self._drag_start_px[0]) * self._inv_width
+            dy = (y - self._drag_start_px[1]) * self._inv_height
             width = self._drag_start_norm[2] - self._drag_start_norm[0]
             height = self._drag_start_norm[3] - self._drag_start_norm[1]
             x_min = self._clamp(self._drag_start_norm[0] + dx, 0.0, 1.0 - width)
@@ -210,9 +292,10 @@ class LiveSeatingEditor:
             seat.y_min = y_min
             seat.x_max = x_min + width
             seat.y_max = y_min + height
+            self._invalidate_seat_pixels()
         elif self._drag_state == "resize" and self._drag_anchor:
-            nx = x / max(1, self._frame_width)
-            ny = y / max(1, self._frame_height)
+            nx = x * self._inv_width
+            ny = y * self._inv_height
             if "l" in self._drag_anchor:
                 seat.x_min = self._clamp(nx, 0.0, seat.x_max - self._MIN_EXTENT)
             if "r" in self._drag_anchor:
@@ -221,6 +304,7 @@ class LiveSeatingEditor:
                 seat.y_min = self._clamp(ny, 0.0, seat.y_max - self._MIN_EXTENT)
             if "b" in self._drag_anchor:
                 seat.y_max = self._clamp(ny, seat.y_min + self._MIN_EXTENT, 1.0)
+            self._invalidate_seat_pixels()
 
     def _finish_drag(self, x: int, y: int) -> None:
         self._update_drag(x, y)
@@ -251,7 +335,7 @@ class LiveSeatingEditor:
     def _delete_selected(self) -> None:
         if self._selected_index is None:
             return
-        deleted = self._seats.pop(self._selected_index)
+        deleted = self._remove_seat(self._selected_index)
         LOGGER.info("Removed seat '%s' from live layout", deleted.seat_id)
         if not self._seats:
             self._selected_index = None
@@ -267,7 +351,7 @@ class LiveSeatingEditor:
     def _clear_all(self) -> None:
         if not self._seats:
             return
-        self._seats.clear()
+        self._clear_seats()
         self._selected_index = None
         self._emit_layout()
         self._status_message = "座席を全て削除しました"
@@ -275,15 +359,13 @@ class LiveSeatingEditor:
     def _finalize_new_seat(self, sx: int, sy: int, ex: int, ey: int) -> None:
         x1, x2 = sorted([sx, ex])
         y1, y2 = sorted([sy, ey])
-        width = max(1, self._frame_width)
-        height = max(1, self._frame_height)
-        x_min = self._clamp(x1 / width, 0.0, 1.0 - self._MIN_EXTENT)
-        x_max = self._clamp(x2 / width, x_min + self._MIN_EXTENT, 1.0)
-        y_min = self._clamp(y1 / height, 0.0, 1.0 - self._MIN_EXTENT)
-        y_max = self._clamp(y2 / height, y_min + self._MIN_EXTENT, 1.0)
+        x_min = self._clamp(x1 * self._inv_width, 0.0, 1.0 - self._MIN_EXTENT)
+        x_max = self._clamp(x2 * self._inv_width, x_min + self._MIN_EXTENT, 1.0)
+        y_min = self._clamp(y1 * self._inv_height, 0.0, 1.0 - self._MIN_EXTENT)
+        y_max = self._clamp(y2 * self._inv_height, y_min + self._MIN_EXTENT, 1.0)
         seat_id = self._generate_seat_id()
         draft = _SeatDraft(seat_id=seat_id, x_min=x_min, y_min=y_min, x_max=x_max, y_max=y_max)
-        self._seats.append(draft)
+        self._add_seat(draft)
         self._selected_index = len(self._seats) - 1
         LOGGER.info("Added seat '%s' via live editor", seat_id)
         self._emit_layout()
@@ -291,23 +373,77 @@ class LiveSeatingEditor:
     def _emit_layout(self) -> None:
         if not self._on_layout_changed:
             return
+        now = time.monotonic()
+        if now - self._last_emit < self._EMIT_INTERVAL:
+            # Coalesce bursts (e.g. repeated Delete presses); render() flushes the latest state.
+            self._emit_pending = True
+            return
+        self._emit_pending = False
+        self._last_emit = now
         if not self._seats:
             self._on_layout_changed(None)
             return
-        try:
-            layout = SeatingLayout(seat.to_region() for seat in self._seats)
-        except ValueError as exc:  # pragma: no cover - defensive guard
-            LOGGER.error("Failed to build seating layout: %s", exc)
-            return
-        self._on_layout_changed(layout)
+        if self._layout_cache is None:
+            try:
+                self._layout_cache = SeatingLayout(seat.to_region() for seat in self._seats)
+            except ValueError as exc:  # pragma: no cover - defensive guard
+                LOGGER.error("Failed to build seating layout: %s", exc)
+                return
+        self._on_layout_changed(self._layout_cache)
+
+    def _add_seat(self, seat: _SeatDraft) -> None:
+        self._seat_index[seat.seat_id] = len(self._seats)
+        self._seats.append(seat)
+        self._invalidate_seat_pixels()
+
+    def _remove_seat(self, index: int) -> _SeatDraft:
+        seat = self._seats.pop(index)
+        del self._seat_index[seat.seat_id]
+        for position in range(index, len(self._seats)):
+            self._seat_index[self._seats[position].seat_id] = position
+        self._invalidate_seat_pixels()
+        return seat
+
+    def _clear_seats(self) -> None:
+        self._seats.clear()
+        self._seat_index.clear()
+        self._invalidate_seat_pixels()
+
+    def _invalidate_seat_pixels(self) -> None:
+        self._seat_pixels_cache = None
+        self._seat_polygons_cache = None
+        self._layout_cache = None
+
+    def _seat_pixel_array(self):
+        """Return the pixel bounds of every seat as an ``(N, 4)`` int32 array."""
+
+        if self._seat_pixels_cache is None:
+            bounds = np.array(
+                [(seat.x_min, seat.y_min, seat.x_max, seat.y_max) for seat in self._seats], dtype=np.float64
+            ).reshape(-1, 4)
+            scale = np.array(
+                [self._frame_width, self._frame_height, self._frame_width, self._frame_height], dtype=np.float64
+            )
+            self._seat_pixels_cache = (bounds * scale).astype(np.int32)
+        return self._seat_pixels_cache
+
+    def _seat_polygon_array(self):
+        """Return every seat outline as an ``(N, 4, 2)`` int32 array for ``cv2.polylines``."""
+
+        if self._seat_polygons_cache is None:
+            pixels = self._seat_pixel_array()
+            x1, y1, x2, y2 = pixels[:, 0], pixels[:, 1], pixels[:, 2], pixels[:, 3]
+            corners = np.stack([x1, y1, x2, y1, x2, y2, x1, y2], axis=1)
+            self._seat_polygons_cache = np.ascontiguousarray(corners.reshape(-1, 4, 2), dtype=np.int32)
+        return self._seat_polygons_cache
 
     def _generate_seat_id(self) -> str:
         base = "seat"
-        existing = {seat.seat_id for seat in self._seats}
-        index = 1
+        # Seat ids are usually sequential, so the first free slot is almost always at the end.
+        index = len(self._seats) + 1
         while True:
             candidate = f"{base}-{index:02d}"
-            if candidate not in existing:
+            if candidate not in self._seat_index:
                 return candidate
             index += 1
 
@@ -328,21 +464,32 @@ class LiveSeatingEditor:
             cv2.circle(frame, (cx, cy), self._HANDLE_RADIUS // 2, (255, 255, 0), 1, cv2.LINE_AA)
 
     def _pick_seat(self, x: int, y: int) -> Tuple[Optional[int], Optional[str]]:
-        threshold = self._HANDLE_RADIUS
+        if np is not None and len(self._seats) >= self._VECTOR_PICK_MIN_SEATS:
+            pixels = self._seat_pixel_array()
+            inside = (x >= pixels[:, 0]) & (x <= pixels[:, 2]) & (y >= pixels[:, 1]) & (y <= pixels[:, 3])
+            if not inside.any():
+                return None, None
+            index = int(inside.argmax())
+            x1, y1, x2, y2 = pixels[index].tolist()
+            return index, self._pick_handle(x, y, x1, y1, x2, y2)
         for index, seat in enumerate(self._seats):
             x1, y1, x2, y2 = self._seat_pixels(seat)
             if x1 <= x <= x2 and y1 <= y <= y2:
-                if abs(x - x1) <= threshold and abs(y - y1) <= threshold:
-                    return index, "lt"
-                if abs(x - x2) <= threshold and abs(y - y1) <= threshold:
-                    return index, "rt"
-                if abs(x - x1) <= threshold and abs(y - y2) <= threshold:
-                    return index, "lb"
-                if abs(x - x2) <= threshold and abs(y - y2) <= threshold:
-                    return index, "rb"
-                return index, None
+                return index, self._pick_handle(x, y, x1, y1, x2, y2)
         return None, None
 
+    def _pick_handle(self, x: int, y: int, x1: int, y1: int, x2: int, y2: int) -> Optional[str]:
+        threshold = self._HANDLE_RADIUS
+        if abs(x - x1) <= threshold and abs(y - y1) <= threshold:
+            return "lt"
+        if abs(x - x2) <= threshold and abs(y - y1) <= threshold:
+            return "rt"
+        if abs(x - x1) <= threshold and abs(y - y2) <= threshold:
+            return "lb"
+        if abs(x - x2) <= threshold and abs(y - y2) <= threshold:
+            return "rb"
+        return None
+
     @staticmethod
     def _clamp(value: float, lower: float, upper: float) -> float:
         return max(lower, min(upper, value))
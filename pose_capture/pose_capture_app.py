@@ -3,11 +3,18 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import json
 import logging
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+try:  # pragma: no cover - optional faster JSON codec
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None  # type: ignore
 
 from .providers import SkeletonProvider, SkeletonData, MediaPipeSkeletonProvider
 from .seating import SeatingLayout
@@ -28,6 +35,14 @@ class CaptureConfig:
     seating_layout: Optional[SeatingLayout] = None
     mode: str = "shadow"
     live_seating_editor: bool = True
+    # Frames per transport message; >1 sends ``{"_frames": [...]}``, which receivers must opt into.
+    send_batch_size: int = 1
+    # Flush a partial batch once its oldest frame is this old (0 = only flush on size).
+    send_batch_max_ms: float = 0.0
+    # Encode each frame (or batch) once in the app and hand the bytes to ``transport.send_raw``.
+    emit_bytes: bool = False
+    # Keep ``seating`` results an upstream resolver already tagged with the layout's fingerprint.
+    reuse_tagged_seating: bool = False
 
 
 class PoseCaptureApp:
@@ -37,8 +52,16 @@ class PoseCaptureApp:
         self.config = config
         self._running = False
         self._calibration_data: Optional[dict] = None
-        self._seating_layout = config.seating_layout
+        self._seating_layout = self._prepare_layout(config.seating_layout)
         self._live_editor_enabled = False
+        self._inflight: Optional[asyncio.Task] = None
+        self._dropped_frames = 0
+        self._batch: List[SkeletonData] = []
+        self._batch_started = 0.0
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._static_metadata: dict = {}
+        self._static_metadata_sources: tuple = (None, None, None)
+        self._send_raw = None
 
     async def __aenter__(self) -> "PoseCaptureApp":
         await self.start()
@@ -50,36 +73,153 @@ class PoseCaptureApp:
     async def start(self) -> None:
         LOGGER.info("Starting PoseCaptureApp")
         self._running = True
-        self.config.provider.start()
+        # Opening the camera (and, on stop, joining provider threads) can block for a while; keep it
+        # off the event loop, which the launcher drives from the Tk thread.
+        await asyncio.get_running_loop().run_in_executor(None, self.config.provider.start)
         self._maybe_enable_live_editor()
         await self.config.transport.connect()
+        self._send_raw = self._resolve_send_raw()
         if self.config.calibration_file:
             self._calibration_data = self._load_calibration(self.config.calibration_file)
 
     async def stop(self) -> None:
         LOGGER.info("Stopping PoseCaptureApp")
         self._running = False
+        self._cancel_batch_timer()
+        await self._drain_inflight()
+        if self._batch:
+            frames, self._batch = self._batch, []
+            try:
+                await self._send_batch(frames)
+            except Exception as exc:  # pragma: no cover - best effort during shutdown
+                LOGGER.warning("Failed to flush %d batched frames: %s", len(frames), exc)
+        if self._dropped_frames:
+            LOGGER.info("Dropped %d frames while a send was still in flight", self._dropped_frames)
         await self.config.transport.close()
-        self.config.provider.stop()
+        await asyncio.get_running_loop().run_in_executor(None, self.config.provider.stop)
 
     async def run(self) -> None:
         if not self._running:
             await self.start()
+        interval = self.config.frame_interval
+        # Pace against absolute deadlines so capture/send time does not stretch every frame.
+        loop_start = time.monotonic()
+        frame_index = 0
         while self._running:
             skeleton = self.config.provider.get_latest()
             if skeleton:
-                enriched = self._apply_metadata(skeleton)
-                await self.config.transport.send(enriched)
-            await asyncio.sleep(self.config.frame_interval)
+                self._dispatch(skeleton)
+            if interval <= 0:
+                await asyncio.sleep(0)
+                continue
+            frame_index += 1
+            now = time.monotonic()
+            delay = loop_start + frame_index * interval - now
+            if delay < -interval:
+                # More than a frame behind: resynchronise instead of bursting to catch up.
+                frame_index = int((now - loop_start) / interval)
+                delay = 0.0
+            await asyncio.sleep(max(0.0, delay))
+
+    def _dispatch(self, skeleton: SkeletonData) -> None:
+        """Send ``skeleton`` in the background, dropping it if the previous send has not finished.
+
+        When batching, frames keep accumulating while a batch is in flight; only the oldest
+        frames beyond ``send_batch_size`` are dropped so a stalled client cannot grow the backlog.
+        """
+
+        batch_size = self.config.send_batch_size
+        inflight = self._inflight
+        busy = inflight is not None and not inflight.done()
+        if inflight is not None and not busy:
+            self._inflight = None
+            inflight.result()  # re-raise transport errors just like the awaited send used to
+        if batch_size <= 1:
+            if busy:
+                # A stalled client must not backlog stale poses; the next fresh frame goes out instead.
+                self._dropped_frames += 1
+                return
+            enriched = self._apply_metadata(skeleton)
+            if self._send_raw is not None:
+                self._inflight = asyncio.create_task(self._send_raw(_encode_frame(enriched.to_dict())))
+            else:
+                self._inflight = asyncio.create_task(self.config.transport.send(enriched))
+            return
+        if not busy and len(self._batch) >= batch_size:
+            self._flush_batch()  # filled up while the previous batch was in flight
+            busy = True
+        enriched = self._apply_metadata(skeleton)
+        now = time.monotonic()
+        max_age = self.config.send_batch_max_ms / 1000.0
+        if not self._batch:
+            self._batch_started = now
+            if max_age > 0:
+                # Cap the latency of a partial batch even if the provider stops producing frames.
+                self._batch_timer = asyncio.get_running_loop().call_later(max_age, self._on_batch_deadline)
+        self._batch.append(enriched)
+        if busy:
+            if len(self._batch) > batch_size:
+                del self._batch[0]
+                self._dropped_frames += 1
+            return
+        if len(self._batch) >= batch_size or (max_age > 0 and now - self._batch_started >= max_age):
+            self._flush_batch()
+
+    def _flush_batch(self) -> None:
+        self._cancel_batch_timer()
+        frames, self._batch = self._batch, []
+        if frames:
+            self._inflight = asyncio.create_task(self._send_batch(frames))
+
+    def _send_batch(self, frames: List[SkeletonData]):
+        if self._send_raw is not None:
+            return self._send_raw(_encode_frame({"_frames": [frame.to_dict() for frame in frames]}))
+        return self.config.transport.send_batch(frames)
+
+    def _on_batch_deadline(self) -> None:
+        self._batch_timer = None
+        if not self._batch or not self._running:
+            return
+        inflight = self._inflight
+        if inflight is not None:
+            if not inflight.done():
+                # The previous send is still going; flush as soon as it completes.
+                inflight.add_done_callback(lambda _task: self._on_batch_deadline())
+                return
+            if inflight.cancelled() or inflight.exception() is not None:
+                return  # leave the error for the next _dispatch to re-raise
+            self._inflight = None
+        self._flush_batch()
+
+    def _cancel_batch_timer(self) -> None:
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+
+    def _resolve_send_raw(self):
+        if not self.config.emit_bytes:
+            return None
+        transport = self.config.transport
+        send_raw = getattr(type(transport), "send_raw", None)
+        if send_raw is None or send_raw is SkeletonTransport.send_raw:
+            LOGGER.warning("%s cannot send pre-encoded frames; using send()", type(transport).__name__)
+            return None
+        return transport.send_raw
+
+    async def _drain_inflight(self, timeout: float = 1.0) -> None:
+        inflight, self._inflight = self._inflight, None
+        if inflight is None:
+            return
+        done, _ = await asyncio.wait([inflight], timeout=timeout)
+        if not done:
+            inflight.cancel()
+            LOGGER.warning("Cancelled a skeleton send that did not finish within %.1f seconds", timeout)
+        elif not inflight.cancelled() and inflight.exception() is not None:
+            LOGGER.warning("Final skeleton send failed: %s", inflight.exception())
 
     def _apply_metadata(self, skeleton: SkeletonData) -> SkeletonData:
-        merged = dict(skeleton.metadata or {})
-        if self._calibration_data:
-            merged.update(self._calibration_data)
-        if self.config.metadata:
-            merged.update(self.config.metadata)
-        if self.config.mode:
-            merged["mode"] = self.config.mode
+        static = self._get_static_metadata()
+        merged = {**skeleton.metadata, **static} if skeleton.metadata else dict(static)
         if self._seating_layout:
             seating_metadata = self._seating_layout.evaluate(skeleton)
             if seating_metadata:
@@ -89,31 +229,60 @@ class PoseCaptureApp:
         else:
             merged.pop("seating", None)
         skeleton.metadata = merged
-        LOGGER.debug("Enriched skeleton payload: %s", json.dumps(skeleton.to_dict()))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Enriched skeleton payload: %s", _dumps(skeleton.to_dict()))
         return skeleton
 
+    def _get_static_metadata(self) -> dict:
+        """Calibration, user metadata and mode merged once, rebuilt only when one of them is replaced."""
+
+        sources = (self._calibration_data, self.config.metadata, self.config.mode)
+        cached = self._static_metadata_sources
+        if not (sources[0] is cached[0] and sources[1] is cached[1] and sources[2] == cached[2]):
+            static: dict = {}
+            if self._calibration_data:
+                static.update(self._calibration_data)
+            if self.config.metadata:
+                static.update(self.config.metadata)
+            if self.config.mode:
+                static["mode"] = self.config.mode
+            self._static_metadata = static
+            self._static_metadata_sources = sources
+        return self._static_metadata
+
     def _load_calibration(self, path: Path) -> dict:
         LOGGER.info("Loading calibration file from %s", path)
         if not path.exists():
             LOGGER.warning("Calibration file %s does not exist", path)
             return {}
-        data = json.loads(path.read_text())
+        data = _read_json_file(path)
         LOGGER.debug("Calibration data: %s", data)
         return data
 
     async def update_seating_layout(self, layout: Optional[SeatingLayout]) -> None:
         """Replace the active seating layout while the app is running."""
 
-        self._seating_layout = layout
+        self._seating_layout = self._prepare_layout(layout)
         self.config.seating_layout = layout
         updater = getattr(self.config.provider, "update_live_seating_layout", None)
         if callable(updater):
             updater(layout)
 
     def _handle_live_layout_update(self, layout: Optional[SeatingLayout]) -> None:
-        self._seating_layout = layout
+        self._seating_layout = self._prepare_layout(layout)
         self.config.seating_layout = layout
 
+    def _prepare_layout(self, layout: Optional[SeatingLayout]) -> Optional[SeatingLayout]:
+        """Apply ``reuse_tagged_seating`` to layouts built without it (editor and launcher layouts)."""
+
+        if (
+            layout is None
+            or not self.config.reuse_tagged_seating
+            or getattr(layout, "reuse_tagged_results", True)
+        ):
+            return layout
+        return SeatingLayout(layout.seats, reuse_tagged_results=True)
+
     def _maybe_enable_live_editor(self) -> None:
         if self._live_editor_enabled:
             return
@@ -169,9 +338,71 @@ def create_argument_parser() -> argparse.ArgumentParser:
         help="Disable live seat editing even when the preview window is open",
     )
     parser.set_defaults(live_seating_editor=True)
+    parser.add_argument(
+        "--send-batch-size",
+        type=int,
+        default=1,
+        help="Frames per transport message; values above 1 send {\"_frames\": [...]} batches",
+    )
+    parser.add_argument(
+        "--send-batch-max-ms",
+        type=float,
+        default=0.0,
+        help="Flush a partial batch once its oldest frame is this many milliseconds old (0 disables)",
+    )
+    parser.add_argument(
+        "--reuse-tagged-seating",
+        action="store_true",
+        help="Keep seating results already tagged with this layout's fingerprint instead of re-evaluating them",
+    )
+    parser.add_argument(
+        "--binary-frames",
+        action="store_true",
+        help="EXPERIMENTAL: send float16 binary frames instead of JSON; the Unity PoseReceiver cannot decode them",
+    )
+    parser.add_argument(
+        "--emit-bytes",
+        action="store_true",
+        help="Encode each frame or batch once and send the raw bytes (WebSocket frames become binary messages)",
+    )
     return parser
 
 
+def _read_json(path: Path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+# Config files are re-read on every start (and on every GUI relaunch); keyed on mtime so an edited
+# file is picked up while an unchanged one is not parsed again. Cached values are shared: treat
+# them as read-only.
+@functools.lru_cache(maxsize=8)
+def _read_json_cached(path_str: str, mtime_ns: int):
+    return _read_json(Path(path_str))
+
+
+@functools.lru_cache(maxsize=8)
+def _read_seating_cached(path_str: str, mtime_ns: int, reuse_tagged_results: bool = False) -> SeatingLayout:
+    return SeatingLayout.from_json(Path(path_str), reuse_tagged_results=reuse_tagged_results)
+
+
+def _read_json_file(path: Path):
+    return _read_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _dumps(payload) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload)
+
+
+def _encode_frame(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
 def _load_metadata(path: Optional[Path]) -> dict:
     if not path:
         return {}
@@ -179,34 +410,34 @@ def _load_metadata(path: Optional[Path]) -> dict:
         LOGGER.warning("Metadata file %s was not found; ignoring", path)
         return {}
     try:
-        return json.loads(path.read_text())
-    except json.JSONDecodeError as exc:
+        return _read_json_file(path)
+    except json.JSONDecodeError as exc:  # orjson.JSONDecodeError subclasses this too
         LOGGER.error("Failed to parse metadata JSON from %s: %s", path, exc)
         return {}
 
 
-def _load_seating(path: Optional[Path]) -> Optional[SeatingLayout]:
+def _load_seating(path: Optional[Path], reuse_tagged_results: bool = False) -> Optional[SeatingLayout]:
     if not path:
         return None
     if not path.exists():
         LOGGER.warning("Seating config %s was not found; seating metadata disabled", path)
         return None
     try:
-        return SeatingLayout.from_json(path)
+        return _read_seating_cached(str(path), path.stat().st_mtime_ns, reuse_tagged_results)
     except Exception as exc:  # pragma: no cover - defensive parsing guard
         LOGGER.error("Failed to load seating config %s: %s", path, exc)
         return None
 
 
-def _build_transport(transport: str, endpoint: str) -> SkeletonTransport:
+def _build_transport(transport: str, endpoint: str, binary: bool = False) -> SkeletonTransport:
     if transport == "ws":
         uri = endpoint if endpoint.startswith("ws://") or endpoint.startswith("wss://") else f"ws://{endpoint}"
-        return WebSocketSkeletonTransport(uri=uri)
+        return WebSocketSkeletonTransport(uri=uri, binary=binary)
     if transport == "udp":
         if ":" not in endpoint:
             raise ValueError("UDP endpoint must be in host:port format")
         host, port_str = endpoint.rsplit(":", 1)
-        return UDPSkeletonTransport(host=host or "127.0.0.1", port=int(port_str))
+        return UDPSkeletonTransport(host=host or "127.0.0.1", port=int(port_str), binary=binary)
     raise ValueError(f"Unsupported transport type {transport!r}")
 
 
@@ -231,10 +462,15 @@ def _build_provider(args: "argparse.Namespace") -> SkeletonProvider:
 def build_config_from_args(args: "argparse.Namespace") -> CaptureConfig:
     """Create a :class:`CaptureConfig` instance from parsed arguments."""
 
+    binary_frames = getattr(args, "binary_frames", False)
+    if binary_frames and (getattr(args, "send_batch_size", 1) > 1 or getattr(args, "emit_bytes", False)):
+        # Batches and pre-encoded frames are always JSON; they would silently bypass binary framing.
+        raise ValueError("--binary-frames cannot be combined with --send-batch-size > 1 or --emit-bytes")
     provider = _build_provider(args)
-    transport = _build_transport(args.transport, args.endpoint)
+    transport = _build_transport(args.transport, args.endpoint, binary_frames)
     metadata = _load_metadata(getattr(args, "metadata", None))
-    seating_layout = _load_seating(getattr(args, "seating_config", None))
+    reuse_tagged_seating = getattr(args, "reuse_tagged_seating", False)
+    seating_layout = _load_seating(getattr(args, "seating_config", None), reuse_tagged_seating)
 
     return CaptureConfig(
         provider=provider,
@@ -245,6 +481,10 @@ def build_config_from_args(args: "argparse.Namespace") -> CaptureConfig:
         seating_layout=seating_layout,
         mode=getattr(args, "mode", "shadow"),
         live_seating_editor=getattr(args, "live_seating_editor", True),
+        send_batch_size=getattr(args, "send_batch_size", 1),
+        send_batch_max_ms=getattr(args, "send_batch_max_ms", 0.0),
+        emit_bytes=getattr(args, "emit_bytes", False),
+        reuse_tagged_seating=reuse_tagged_seating,
     )
 
 
@@ -259,5 +499,16 @@ async def main(args: Optional["argparse.Namespace"] = None) -> None:
         await app.run()
 
 
+def _run_cli() -> None:
+    try:  # pragma: no cover - optional faster event loop (not available on Windows)
+        import uvloop  # type: ignore
+    except ImportError:  # pragma: no cover - stdlib event loop
+        uvloop = None  # type: ignore
+    if uvloop is not None and hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
+
+
 if __name__ == "__main__":  # pragma: no cover - CLI entry point
-    asyncio.run(main())
+    _run_cli()
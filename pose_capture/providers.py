@@ -3,7 +3,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, TYPE_CHECKING
+import asyncio
 import logging
+import threading
 import time
 
 try:
@@ -29,8 +31,10 @@ if TYPE_CHECKING:  # pragma: no cover - import for type hints only
 
 LOGGER = logging.getLogger(__name__)
 
+_NO_LAYOUT = object()  # sentinel: no live layout update queued (``None`` clears the layout)
 
-@dataclass
+
+@dataclass(slots=True)
 class Joint:
     """Represents a single joint."""
 
@@ -40,7 +44,7 @@ class Joint:
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SkeletonData:
     """Container for skeleton information."""
 
@@ -51,26 +55,16 @@ class SkeletonData:
     def to_dict(self) -> Mapping[str, object]:
         """Serialize to a JSON-compatible dict."""
 
-        def _as_vec(values: Optional[List[float]], expected: int) -> Optional[Dict[str, float]]:
-            if not values:
-                return None
-            padded = list(values[:expected]) + [0.0] * max(0, expected - len(values))
-            if expected == 3:
-                return {"x": padded[0], "y": padded[1], "z": padded[2]}
-            if expected == 4:
-                return {"x": padded[0], "y": padded[1], "z": padded[2], "w": padded[3]}
-            raise ValueError(f"Unsupported vector size {expected}")
-
         payload = {
             "_timestamp": self.timestamp_ms,
             "_joints": [
                 {
                     "_name": joint.name,
-                    "_position": _as_vec(joint.position, 3),
-                    "_rotation": _as_vec(joint.rotation, 4),
+                    "_position": _vec3(joint.position),
+                    "_rotation": _vec4(joint.rotation),
                     "_confidence": joint.confidence,
                 }
-                for joint in sorted(self.joints.values(), key=lambda j: j.name)
+                for joint in self.joints.values()
             ],
         }
         if self.metadata:
@@ -78,6 +72,25 @@ class SkeletonData:
         return payload
 
 
+# PoseReceiver.cs deserialises with Newtonsoft JsonConvert into ``JointSample``, whose
+# ``_position``/``_rotation`` are Vector3/Quaternion, so vectors stay ``{"x", "y", "z"[, "w"]}``
+# objects. Full-length inputs skip the slice-and-pad copy.
+def _vec3(values: Optional[List[float]]) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    if len(values) < 3:
+        values = list(values) + [0.0] * (3 - len(values))
+    return {"x": values[0], "y": values[1], "z": values[2]}
+
+
+def _vec4(values: Optional[List[float]]) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    if len(values) < 4:
+        values = list(values) + [0.0] * (4 - len(values))
+    return {"x": values[0], "y": values[1], "z": values[2], "w": values[3]}
+
+
 class SkeletonProvider:
     """Abstract base class for skeleton providers."""
 
@@ -94,6 +107,47 @@ class SkeletonProvider:
         """Stop the provider and release resources."""
 
 
+class _FrameReader:
+    """Reads camera frames on its own thread so decoding overlaps with pose inference.
+
+    Only the newest unread frame is kept; the inference loop never works on a stale one.
+    """
+
+    def __init__(self, capture: "cv2.VideoCapture") -> None:
+        self._capture = capture
+        self._condition = threading.Condition()
+        self._frame = None
+        self.failed = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="camera-reader", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:  # pragma: no cover - requires camera input
+        while not self._closed:
+            success, frame = self._capture.read()
+            with self._condition:
+                if success:
+                    self._frame = frame
+                self.failed = not success
+                self._condition.notify_all()
+            if not success:
+                time.sleep(0.01)
+
+    def next_frame(self, timeout: float):
+        """Return the newest frame not handed out yet, or ``None`` on failure, close or timeout."""
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._frame is not None or self.failed or self._closed, timeout)
+            frame, self._frame = self._frame, None
+        return frame
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout=2.0)
+
+
 class MediaPipeSkeletonProvider(SkeletonProvider):
     """Skeleton provider backed by MediaPipe running on a webcam feed."""
 
@@ -123,6 +177,8 @@ class MediaPipeSkeletonProvider(SkeletonProvider):
         self._camera_index = camera_index
         self._image_size = image_size
         self._capture: Optional["cv2.VideoCapture"] = None
+        self._reader: Optional[_FrameReader] = None
+        self._rgb_buffer = None  # reused BGR->RGB conversion target, owned by the capture thread
         self._last_frame_fail = False
         self._preview_enabled = preview
         self._preview_window = preview_window
@@ -133,9 +189,27 @@ class MediaPipeSkeletonProvider(SkeletonProvider):
         self._live_seating_editor_requested = live_seating_editor
         self._live_seating_editor: Optional[LiveSeatingEditor] = None
         self._live_layout_callback: Optional[Callable[[Optional["SeatingLayout"]], None]] = None
-        self.joint_order = [
+        self._live_layout_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Inference runs on ``_worker`` and HighGUI on ``_preview_thread``; the event loop only reads
+        # ``_latest``. Both hand-offs are single slots, so nobody ever works on a stale frame.
+        self._worker: Optional[threading.Thread] = None
+        self._preview_thread: Optional[threading.Thread] = None
+        self._preview_ready = threading.Event()
+        self._preview_condition = threading.Condition()
+        self._preview_item: Optional[Tuple[object, object]] = None
+        self._stop_event = threading.Event()
+        self._latest_lock = threading.Lock()
+        self._latest: Optional[SkeletonData] = None
+        self._worker_error: Optional[BaseException] = None
+        self._pending_live_layout: object = _NO_LAYOUT
+        self._landmark_names: Tuple[str, ...] = tuple(
             j.name for j in mp.solutions.pose.PoseLandmark
-        ]  # type: ignore[attr-defined]
+        )  # type: ignore[attr-defined]
+        self.joint_order = list(self._landmark_names)
+        pose_landmark = mp.solutions.pose.PoseLandmark
+        self._left_hip_idx: int = pose_landmark.LEFT_HIP.value
+        self._right_hip_idx: int = pose_landmark.RIGHT_HIP.value
+        self._pose_connections = mp.solutions.pose.POSE_CONNECTIONS
 
     def _ensure_capture(self) -> None:
         if self._capture is not None and self._capture.isOpened():
@@ -143,6 +217,11 @@ class MediaPipeSkeletonProvider(SkeletonProvider):
         self._capture = cv2.VideoCapture(self._camera_index)
         if not self._capture.isOpened():
             raise RuntimeError(f"Failed to open camera index {self._camera_index}")
+        # MJPG lets USB cameras deliver full frame rate at high resolutions, and a one-frame driver
+        # buffer keeps read() returning the newest frame instead of a queued one. Both are hints:
+        # backends that do not support them simply ignore the call. FOURCC must precede the size.
+        self._capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        self._capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         if self._image_size:
             width, height = self._image_size
             if width:
@@ -153,32 +232,107 @@ class MediaPipeSkeletonProvider(SkeletonProvider):
     def start(self) -> None:  # pragma: no cover - requires camera input
         LOGGER.info("Starting MediaPipe capture on camera %d", self._camera_index)
         self._ensure_capture()
+        if self._worker is not None:
+            return
+        self._stop_event.clear()
+        self._worker_error = None
         if self._preview_enabled:
-            cv2.namedWindow(self._preview_window, cv2.WINDOW_NORMAL)
-            if self._live_seating_editor_requested:
-                self._ensure_live_editor()
+            self._preview_ready.clear()
+            self._preview_thread = threading.Thread(target=self._preview_loop, name="mediapipe-preview", daemon=True)
+            self._preview_thread.start()
+            # The preview window is created on its own thread; wait so callers can attach to it.
+            self._preview_ready.wait()
+        self._reader = _FrameReader(self._capture)
+        self._worker = threading.Thread(target=self._capture_loop, name="mediapipe-capture", daemon=True)
+        self._worker.start()
 
-    def get_latest(self) -> Optional[SkeletonData]:  # pragma: no cover - requires camera input
-        if self._capture is None:
+    def get_latest(self) -> Optional[SkeletonData]:
+        """Return the newest skeleton produced by the capture thread, or ``None`` if nothing new arrived."""
+
+        if self._worker_error is not None:
+            raise RuntimeError("MediaPipe capture thread failed") from self._worker_error
+        if self._worker is None:
             LOGGER.debug("MediaPipe provider has not been started yet")
             return None
+        with self._latest_lock:
+            skeleton, self._latest = self._latest, None
+        return skeleton
 
-        success, frame = self._capture.read()
-        if not success:
-            if not self._last_frame_fail:
-                LOGGER.warning("Failed to read frame from camera %d", self._camera_index)
-            self._last_frame_fail = True
+    def _capture_loop(self) -> None:  # pragma: no cover - requires camera input
+        try:
+            while not self._stop_event.is_set():
+                skeleton = self._capture_skeleton()
+                if skeleton is None:
+                    if self._last_frame_fail:
+                        self._stop_event.wait(0.01)  # avoid spinning on a camera that keeps failing
+                    continue
+                with self._latest_lock:
+                    self._latest = skeleton  # keep only the newest frame; latency over throughput
+        except Exception as exc:
+            LOGGER.exception("MediaPipe capture thread stopped: %s", exc)
+            self._worker_error = exc
+
+    def _queue_preview(self, bgr_frame, landmarks) -> None:
+        if not self._preview_enabled:
+            return
+        with self._preview_condition:
+            self._preview_item = (bgr_frame, landmarks)  # replaces a frame the preview has not shown yet
+            self._preview_condition.notify()
+
+    def _preview_loop(self) -> None:  # pragma: no cover - requires a display
+        try:
+            cv2.namedWindow(self._preview_window, cv2.WINDOW_NORMAL)
+            if self._live_seating_editor_requested:
+                self._ensure_live_editor()
+        except Exception as exc:
+            LOGGER.exception("Failed to open preview window: %s", exc)
+            self._preview_enabled = False
+            return
+        finally:
+            self._preview_ready.set()
+        try:
+            while self._preview_enabled and not self._stop_event.is_set():
+                with self._preview_condition:
+                    self._preview_condition.wait_for(
+                        lambda: self._preview_item is not None or self._stop_event.is_set(), 0.05
+                    )
+                    item, self._preview_item = self._preview_item, None
+                if item is None:
+                    cv2.waitKey(1)  # keep the window responsive while no frames arrive
+                    continue
+                self._show_preview(*item)
+        except Exception as exc:
+            LOGGER.exception("Preview rendering stopped: %s", exc)
+            self._preview_enabled = False
+        finally:
+            try:
+                cv2.destroyWindow(self._preview_window)
+            except cv2.error:  # pragma: no cover - window already closed
+                pass
+
+    def _capture_skeleton(self) -> Optional[SkeletonData]:  # pragma: no cover - requires camera input
+        frame = self._reader.next_frame(timeout=1.0)
+        if frame is None:
+            if self._reader.failed:
+                if not self._last_frame_fail:
+                    LOGGER.warning("Failed to read frame from camera %d", self._camera_index)
+                self._last_frame_fail = True
             return None
         self._last_frame_fail = False
 
-        image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        image_rgb = self._rgb_buffer
+        if image_rgb is None or image_rgb.shape != frame.shape:
+            image_rgb = self._rgb_buffer = frame.copy()
+        # Convert into the reused buffer; it is only marked read-only (so MediaPipe can wrap it
+        # without copying) while inference runs.
+        image_rgb.flags.writeable = True
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=image_rgb)
         image_rgb.flags.writeable = False
         results = self._pose.process(image_rgb)
 
         if not results.pose_landmarks:
             LOGGER.debug("No pose landmarks detected in current frame")
-            if self._preview_enabled:
-                self._show_preview(frame, None)
+            self._queue_preview(frame, None)
             return None
 
         world_landmarks = getattr(results, "pose_world_landmarks", None)
@@ -186,28 +340,20 @@ class MediaPipeSkeletonProvider(SkeletonProvider):
             LOGGER.debug("pose_world_landmarks not available, using pose_landmarks with Z coordinate")
         skeleton = SkeletonData(timestamp_ms=int(time.time() * 1000))
 
-        for idx, landmark in enumerate(results.pose_landmarks.landmark):
-            try:
-                landmark_enum = mp.solutions.pose.PoseLandmark(idx)
-                name = landmark_enum.name
-            except ValueError:  # pragma: no cover - defensive guard
-                LOGGER.debug("Skipping unknown landmark index %d", idx)
-                continue
-
-            if world_landmarks and idx < len(world_landmarks.landmark):
-                world = world_landmarks.landmark[idx]
-                position = [world.x, world.y, world.z]
-            else:
-                z_value = getattr(landmark, "z", 0.0)
-                position = [landmark.x, landmark.y, z_value]
-
-            joint = Joint(
+        # zip() against the precomputed name table replaces a PoseLandmark(idx) lookup per joint and
+        # stops at the last known landmark, like the old "skip unknown index" guard did.
+        world = world_landmarks.landmark if world_landmarks else ()
+        world_count = len(world)
+        rotation = self._IDENTITY_ROTATION
+        joints = skeleton.joints
+        for idx, (name, landmark) in enumerate(zip(self._landmark_names, results.pose_landmarks.landmark)):
+            source = world[idx] if idx < world_count else landmark
+            joints[name] = Joint(
                 name=name,
-                position=position,
-                rotation=self._IDENTITY_ROTATION,
-                confidence=float(getattr(landmark, "visibility", 1.0)),
+                position=[source.x, source.y, source.z],
+                rotation=rotation,
+                confidence=float(landmark.visibility),
             )
-            skeleton.joints[name] = joint
 
         skeleton.metadata = {
             "provider": "mediapipe",
@@ -221,31 +367,48 @@ class MediaPipeSkeletonProvider(SkeletonProvider):
             )
         )
 
-        if self._preview_enabled:
-            self._show_preview(frame, results.pose_landmarks)
+        self._queue_preview(frame, results.pose_landmarks)
         return skeleton
 
     def stop(self) -> None:  # pragma: no cover - requires camera input
         LOGGER.info("Stopping MediaPipe capture")
-        if self._capture is not None:
-            self._capture.release()
+        self._stop_event.set()
+        stuck: List[str] = []
+        if self._reader is not None:
+            self._reader.close()  # also wakes the worker if it is waiting for a frame
+            if self._reader._thread.is_alive():
+                stuck.append(self._reader._thread.name)
+        with self._preview_condition:
+            self._preview_condition.notify_all()
+        for thread in (self._worker, self._preview_thread):
+            if thread is None:
+                continue
+            thread.join(timeout=5.0)
+            if thread.is_alive():
+                stuck.append(thread.name)
+        self._worker = None
+        self._preview_thread = None
+        self._reader = None
+        if stuck:
+            # Releasing native handles under a running thread is a use-after-close; leak them instead.
+            LOGGER.warning("%s did not stop in time; leaving the camera and pose model open", ", ".join(stuck))
+        else:
+            if self._capture is not None:
+                self._capture.release()
+            self._pose.close()
         self._capture = None
-        self._pose.close()
-        if self._preview_enabled:
-            try:
-                cv2.destroyWindow(self._preview_window)
-            except cv2.error:  # pragma: no cover - window already closed
-                pass
         self._live_seating_editor = None
         self._live_layout_callback = None
+        self._live_layout_loop = None
 
     def _show_preview(self, bgr_frame, landmarks) -> None:
-        annotated = bgr_frame.copy()
+        self._apply_pending_live_layout()
+        annotated = bgr_frame  # every frame comes fresh from the reader and is owned by this thread now
         if landmarks is not None:
             self._drawing_utils.draw_landmarks(
                 annotated,
                 landmarks,
-                mp.solutions.pose.POSE_CONNECTIONS,
+                self._pose_connections,
                 landmark_drawing_spec=self._pose_landmark_style,
                 connection_drawing_spec=self._pose_connection_style,
             )
@@ -290,17 +453,33 @@ class MediaPipeSkeletonProvider(SkeletonProvider):
             LOGGER.warning("Live seating editor requires the preview window; enable --preview to use it")
             return False
         self._live_layout_callback = on_layout_changed
+        try:
+            # Edits arrive on the preview thread; the callback belongs to the caller's event loop.
+            self._live_layout_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._live_layout_loop = None
         if not self._ensure_live_editor():
             return False
-        if self._live_seating_editor:
-            self._live_seating_editor.set_on_layout_changed(on_layout_changed)
-            self._live_seating_editor.set_layout(initial_layout)
+        # The editor forwards changes through _forward_live_layout, which reads the callback set above.
+        self._queue_live_layout(initial_layout)
         return self._live_seating_editor is not None
 
     def update_live_seating_layout(self, layout: Optional["SeatingLayout"]) -> None:
         if not self._live_seating_editor:
             return
-        self._live_seating_editor.set_layout(layout)
+        self._queue_live_layout(layout)
+
+    def _queue_live_layout(self, layout: Optional["SeatingLayout"]) -> None:
+        # The editor is created and rendered on the preview thread (``_preview_loop``); hand it the
+        # layout to apply before its next draw instead of mutating it from the caller's thread.
+        with self._latest_lock:
+            self._pending_live_layout = layout
+
+    def _apply_pending_live_layout(self) -> None:
+        with self._latest_lock:
+            layout, self._pending_live_layout = self._pending_live_layout, _NO_LAYOUT
+        if layout is not _NO_LAYOUT and self._live_seating_editor:
+            self._live_seating_editor.set_layout(layout)
 
     def _ensure_live_editor(self) -> bool:
         if self._live_seating_editor:
@@ -316,8 +495,17 @@ class MediaPipeSkeletonProvider(SkeletonProvider):
         return True
 
     def _forward_live_layout(self, layout: Optional["SeatingLayout"]) -> None:
-        if self._live_layout_callback:
-            self._live_layout_callback(layout)
+        callback = self._live_layout_callback
+        if not callback:
+            return
+        loop = self._live_layout_loop
+        if loop is None:
+            callback(layout)
+            return
+        try:
+            loop.call_soon_threadsafe(callback, layout)
+        except RuntimeError:  # loop already closed during shutdown
+            LOGGER.debug("Dropping live seating layout update; event loop is closed")
 
     def _resolve_landmark_style(self):
         getter = getattr(self._drawing_styles, "get_default_pose_landmarks_style", None)
@@ -339,18 +527,19 @@ class MediaPipeSkeletonProvider(SkeletonProvider):
 
     def _build_root_metadata(self, landmarks, world_landmarks, frame_shape) -> Dict[str, object]:
         metadata: Dict[str, object] = {}
+        left_idx = self._left_hip_idx
+        right_idx = self._right_hip_idx
         try:
-            left_idx = mp.solutions.pose.PoseLandmark.LEFT_HIP.value
-            right_idx = mp.solutions.pose.PoseLandmark.RIGHT_HIP.value
             left = landmarks[left_idx]
             right = landmarks[right_idx]
         except (AttributeError, IndexError, TypeError):  # pragma: no cover - defensive guard
             return metadata
 
-        root_x = float((left.x + right.x) * 0.5)
-        root_y = float((left.y + right.y) * 0.5)
-        root_z = float((getattr(left, "z", 0.0) + getattr(right, "z", 0.0)) * 0.5)
-        metadata["root_center_normalized"] = {"x": root_x, "y": root_y, "z": root_z}
+        # Landmark fields are already Python floats (and always define z), so no casts or getattr
+        # fallbacks are needed; NumPy would cost more than these six scalar operations.
+        root_x = (left.x + right.x) * 0.5
+        root_y = (left.y + right.y) * 0.5
+        metadata["root_center_normalized"] = {"x": root_x, "y": root_y, "z": (left.z + right.z) * 0.5}
 
         if frame_shape is not None and len(frame_shape) >= 2:
             height = int(frame_shape[0])
@@ -365,10 +554,11 @@ class MediaPipeSkeletonProvider(SkeletonProvider):
             except (IndexError, TypeError):  # pragma: no cover - defensive guard
                 pass
             else:
-                world_x = float((left_world.x + right_world.x) * 0.5)
-                world_y = float((left_world.y + right_world.y) * 0.5)
-                world_z = float((left_world.z + right_world.z) * 0.5)
-                metadata["root_center_world"] = {"x": world_x, "y": world_y, "z": world_z}
+                metadata["root_center_world"] = {
+                    "x": (left_world.x + right_world.x) * 0.5,
+                    "y": (left_world.y + right_world.y) * 0.5,
+                    "z": (left_world.z + right_world.z) * 0.5,
+                }
 
         return metadata
 
@@ -1,15 +1,22 @@
 """Seat layout utilities for pose-driven interactions."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import mmap
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Optional, TYPE_CHECKING
+from typing import Iterable, List, Mapping, Optional, Tuple, TYPE_CHECKING
+
+try:  # pragma: no cover - optional faster JSON decoder
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None  # type: ignore
 
 if TYPE_CHECKING:  # pragma: no cover - import for type hints only
     from .providers import SkeletonData
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SeatRegion:
     """Describes the normalized bounds of a single seat in camera space."""
 
@@ -18,9 +25,15 @@ class SeatRegion:
     y_min: float
     x_max: float
     y_max: float
+    # ``(x_min, y_min, x_max, y_max)`` packed once so per-frame checks read a single attribute.
+    bounds: Tuple[float, float, float, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "bounds", (self.x_min, self.y_min, self.x_max, self.y_max))
 
     def contains(self, x: float, y: float) -> bool:
-        return self.x_min <= x <= self.x_max and self.y_min <= y <= self.y_max
+        x_min, y_min, x_max, y_max = self.bounds
+        return x_min <= x <= x_max and y_min <= y <= y_max
 
     @property
     def width(self) -> float:
@@ -31,10 +44,41 @@ class SeatRegion:
         return max(0.0, self.y_max - self.y_min)
 
 
+# Cells per axis of the uniform grid that buckets seats for ``SeatingLayout.resolve``.
+_GRID_SIZE = 16
+# Roots closer than 1/_ROOT_QUANTUM (about two pixels on a 1080p frame) reuse the previous result.
+_ROOT_QUANTUM = 1024
+
+
+def _grid_cell(value: float) -> int:
+    """Grid column/row of a normalized coordinate, clamped so off-frame values hit the edge cells."""
+
+    index = int(value * _GRID_SIZE)
+    if index < 0:
+        return 0
+    if index >= _GRID_SIZE:
+        return _GRID_SIZE - 1
+    return index
+
+
 class SeatingLayout:
     """Normalized description of seats for occupancy estimation."""
 
-    def __init__(self, seats: Iterable[SeatRegion]) -> None:
+    __slots__ = (
+        "_seats",
+        "_grid",
+        "_seat_bounds",
+        "_last_active",
+        "_last_seats_payload",
+        "_cache_key",
+        "_cache_value",
+        "_fingerprint",
+        "_reuse_tagged_results",
+    )
+
+    def __init__(self, seats: Iterable[SeatRegion], *, reuse_tagged_results: bool = False) -> None:
+        # ``reuse_tagged_results``: pass through a ``seating`` entry that an upstream resolver already
+        # tagged with this layout's fingerprint instead of recomputing it.
         seats = list(seats)
         if not seats:
             raise ValueError("SeatingLayout requires at least one seat")
@@ -46,63 +90,143 @@ class SeatingLayout:
             seen.add(seat.seat_id)
             ordered.append(seat)
         self._seats = ordered
+        # Each cell lists the seats overlapping it in layout order, so the first hit in a cell is the
+        # same seat the linear scan would have returned.
+        grid: List[List[SeatRegion]] = [[] for _ in range(_GRID_SIZE * _GRID_SIZE)]
+        for seat in ordered:
+            try:
+                col_min, col_max = _grid_cell(seat.x_min), _grid_cell(seat.x_max)
+                row_min, row_max = _grid_cell(seat.y_min), _grid_cell(seat.y_max)
+            except (ValueError, OverflowError):
+                # Non-finite bounds cannot be bucketed; keep the seat reachable from every cell.
+                col_min, col_max, row_min, row_max = 0, _GRID_SIZE - 1, 0, _GRID_SIZE - 1
+            for row in range(row_min, row_max + 1):
+                base = row * _GRID_SIZE
+                for col in range(col_min, col_max + 1):
+                    grid[base + col].append(seat)
+        self._grid = grid
+        # Bounds never change for a layout, so their payload dicts are built once and shared by every
+        # ``evaluate`` result; treat them as read-only.
+        self._seat_bounds = [
+            (
+                seat.seat_id,
+                {"xMin": seat.x_min, "xMax": seat.x_max, "yMin": seat.y_min, "yMax": seat.y_max},
+            )
+            for seat in ordered
+        ]
+        # The seats list only depends on which seat is active, which rarely changes between frames.
+        self._last_active: Optional[str] = None
+        self._last_seats_payload = self._build_seats_payload(None)
+        # One-entry cache of the last result, keyed on the root quantized to ``_ROOT_QUANTUM``.
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self._cache_value: Optional[Mapping[str, object]] = None
+        self._fingerprint = hashlib.blake2b(repr(ordered).encode("utf-8"), digest_size=8).hexdigest()
+        self._reuse_tagged_results = reuse_tagged_results
 
     @property
     def seats(self) -> List[SeatRegion]:
         return list(self._seats)
 
+    @property
+    def reuse_tagged_results(self) -> bool:
+        return self._reuse_tagged_results
+
+    @property
+    def fingerprint(self) -> str:
+        """Short digest of the seat ids and bounds; every ``evaluate`` result carries it as ``_layout``."""
+        return self._fingerprint
+
     def resolve(self, x: float, y: float) -> Optional[SeatRegion]:
-        for seat in self._seats:
+        for seat in self._candidates(x, y):
             if seat.contains(x, y):
                 return seat
         return None
 
+    def _candidates(self, x: float, y: float) -> List[SeatRegion]:
+        try:
+            return self._grid[_grid_cell(y) * _GRID_SIZE + _grid_cell(x)]
+        except (ValueError, OverflowError):  # NaN/inf coordinates: fall back to the full scan
+            return self._seats
+
+    def _resolve_with_confidence(self, x: float, y: float) -> Tuple[Optional[SeatRegion], float]:
+        """Find the seat containing ``(x, y)`` and how deep inside it the point sits.
+
+        Confidence is the smaller of the x/y distances to the nearest edge relative to the
+        half-extent, clamped to ``[0, 1]``; it is 0 for degenerate seats and when nothing matches.
+        """
+
+        for seat in self._candidates(x, y):
+            x_min, y_min, x_max, y_max = seat.bounds
+            if not (x_min <= x <= x_max and y_min <= y <= y_max):
+                continue
+            half_width = (x_max - x_min) * 0.5
+            half_height = (y_max - y_min) * 0.5
+            if half_width <= 0 or half_height <= 0:
+                return seat, 0.0
+            margin = min(min(x - x_min, x_max - x) / half_width, min(y - y_min, y_max - y) / half_height)
+            return seat, margin if margin < 1.0 else 1.0
+        return None, 0.0
+
     def evaluate(self, skeleton: "SkeletonData") -> Optional[Mapping[str, object]]:
+        """Return the seating payload for ``skeleton``'s normalized root, or ``None`` without one.
+
+        The result is shared, not copied: while the root stays in the same 1/1024 cell the identical
+        dict is returned again, and its ``seats`` list and ``bounds`` dicts are reused across results
+        until the active seat changes. Callers must treat all of it as read-only.
+        """
+
         metadata = skeleton.metadata or {}
+        if self._reuse_tagged_results:
+            existing = metadata.get("seating")
+            if type(existing) is dict and existing.get("_layout") == self._fingerprint:
+                return existing
         normalized = _extract_normalized_root(metadata)
         if normalized is None:
             return None
-        seat = self.resolve(normalized["x"], normalized["y"])
-        occupancy: Dict[str, bool] = {seat_region.seat_id: False for seat_region in self._seats}
-        confidence = 0.0
-        active_seat_id: Optional[str] = None
-        if seat:
-            occupancy[seat.seat_id] = True
-            active_seat_id = seat.seat_id
-            confidence = _compute_confidence(seat, normalized["x"], normalized["y"])
-
-        return {
+        x, y = normalized
+        try:
+            key: Optional[Tuple[int, int]] = (int(x * _ROOT_QUANTUM), int(y * _ROOT_QUANTUM))
+        except (ValueError, OverflowError):  # NaN/inf roots are resolved but never cached
+            key = None
+        if key is not None and key == self._cache_key:
+            return self._cache_value
+
+        seat, confidence = self._resolve_with_confidence(x, y)
+        active_seat_id = seat.seat_id if seat is not None else None
+
+        if active_seat_id != self._last_active:
+            self._last_seats_payload = self._build_seats_payload(active_seat_id)
+            self._last_active = active_seat_id
+        result = {
             "activeSeatId": active_seat_id,
             "confidence": confidence,
-            "seats": [
-                {
-                    "id": seat_region.seat_id,
-                    "occupied": occupancy[seat_region.seat_id],
-                    "bounds": {
-                        "xMin": seat_region.x_min,
-                        "xMax": seat_region.x_max,
-                        "yMin": seat_region.y_min,
-                        "yMax": seat_region.y_max,
-                    },
-                }
-                for seat_region in self._seats
-            ],
+            "seats": self._last_seats_payload,
+            "_layout": self._fingerprint,
         }
+        self._cache_key = key
+        self._cache_value = result
+        return result
+
+    def _build_seats_payload(self, active_seat_id: Optional[str]) -> List[dict]:
+        return [
+            {"id": seat_id, "occupied": seat_id == active_seat_id, "bounds": bounds}
+            for seat_id, bounds in self._seat_bounds
+        ]
 
     @classmethod
-    def from_mapping(cls, payload: Mapping[str, object]) -> "SeatingLayout":
+    def from_mapping(cls, payload: Mapping[str, object], *, reuse_tagged_results: bool = False) -> "SeatingLayout":
         seats_payload = payload.get("seats")
-        if not isinstance(seats_payload, Iterable):
+        if type(seats_payload) is not list and not isinstance(seats_payload, Iterable):
             raise ValueError("Seating layout payload must contain an iterable 'seats' field")
         seats: List[SeatRegion] = []
         for raw in seats_payload:
-            if not isinstance(raw, Mapping):
+            if not _is_mapping(raw):
                 raise ValueError("Seat entry must be a mapping")
             seat_id = str(raw.get("id") or raw.get("seatId"))
             if not seat_id:
                 raise ValueError("Seat entry missing 'id'")
             bounds = raw.get("bounds")
-            if not isinstance(bounds, Mapping):
+            if not _is_mapping(bounds):
                 raise ValueError(f"Seat '{seat_id}' missing 'bounds'")
             try:
                 x_min = float(bounds.get("xMin"))
@@ -114,50 +238,59 @@ class SeatingLayout:
             if x_min >= x_max or y_min >= y_max:
                 raise ValueError(f"Seat '{seat_id}' has non-positive bounds")
             seats.append(SeatRegion(seat_id=seat_id, x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max))
-        return cls(seats)
+        return cls(seats, reuse_tagged_results=reuse_tagged_results)
 
     @classmethod
-    def from_json(cls, path: Path) -> "SeatingLayout":
-        import json
+    def from_json(cls, path: Path, *, reuse_tagged_results: bool = False) -> "SeatingLayout":
+        if orjson is not None:
+            payload = _load_json_orjson(path)
+        else:
+            import json
 
-        payload = json.loads(path.read_text())
-        if not isinstance(payload, Mapping):
+            payload = json.loads(path.read_text())
+        if not _is_mapping(payload):
             raise ValueError("Seating config root must be a mapping")
-        return cls.from_mapping(payload)
+        return cls.from_mapping(payload, reuse_tagged_results=reuse_tagged_results)
+
 
+def _load_json_orjson(path: Path) -> object:
+    """Parse ``path`` with orjson straight from a read-only memory map."""
 
-def _extract_normalized_root(metadata: Mapping[str, object]) -> Optional[Dict[str, float]]:
-    root = metadata.get("root_center_normalized")
-    if isinstance(root, Mapping):
+    with open(path, "rb") as handle:
         try:
-            return {"x": float(root["x"]), "y": float(root["y"])}
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped; let orjson report the error
+            return orjson.loads(handle.read())
+        with mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def _is_mapping(value: object) -> bool:
+    # Parsed JSON is always plain dicts; the exact type check skips the ABC registry walk and
+    # ``isinstance`` still accepts other mappings handed in programmatically.
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+_ROOT_KEY = "root_center_normalized"
+_PIXEL_KEY = "root_center_pixel"
+_FRAME_KEY = "frame_dimensions"
+
+
+def _extract_normalized_root(metadata: Mapping[str, object]) -> Optional[Tuple[float, float]]:
+    # Runs every frame: index directly and let missing or malformed entries raise instead of
+    # paying for ``isinstance(..., Mapping)`` ABC checks up front.
+    root = metadata.get(_ROOT_KEY)
+    if root is not None:
+        try:
+            return float(root["x"]), float(root["y"])
         except (KeyError, TypeError, ValueError):
             pass
-    pixel = metadata.get("root_center_pixel")
-    frame = metadata.get("frame_dimensions")
-    if isinstance(pixel, Mapping) and isinstance(frame, Mapping):
-        try:
-            x = float(pixel["x"]) / float(frame["width"])
-            y = float(pixel["y"]) / float(frame["height"])
-        except (KeyError, TypeError, ValueError, ZeroDivisionError):
-            return None
-        return {"x": x, "y": y}
-    return None
-
-
-def _compute_confidence(seat: SeatRegion, x: float, y: float) -> float:
-    if seat.width <= 0 or seat.height <= 0:
-        return 0.0
-    margin_x = min(x - seat.x_min, seat.x_max - x)
-    margin_y = min(y - seat.y_min, seat.y_max - y)
-    if margin_x < 0 or margin_y < 0:
-        return 0.0
-    half_width = seat.width * 0.5
-    half_height = seat.height * 0.5
-    if half_width <= 0 or half_height <= 0:
-        return 0.0
-    normalized_margin = min(margin_x / half_width, margin_y / half_height)
-    return max(0.0, min(1.0, normalized_margin))
+    try:
+        pixel = metadata[_PIXEL_KEY]
+        frame = metadata[_FRAME_KEY]
+        return float(pixel["x"]) / float(frame["width"]), float(pixel["y"]) / float(frame["height"])
+    except (KeyError, TypeError, ValueError, ZeroDivisionError):
+        return None
 
 
 __all__ = ["SeatRegion", "SeatingLayout"]
@@ -2,18 +2,44 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import socket
+import struct
 from dataclasses import dataclass, field
 from inspect import isawaitable
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple, Union
 from urllib.parse import urlparse
 
+try:  # pragma: no cover - optional faster JSON encoder
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None  # type: ignore
+
 from .providers import SkeletonData
 
 LOGGER = logging.getLogger(__name__)
 
+# One compact encoder for every frame instead of json.dumps' per-call setup and ", "/": " padding.
+_json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _encode_text(payload: object) -> str:
+    """Encode a payload for a WebSocket text message."""
+
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return _json_encode(payload)
+
+
+def _encode_bytes(payload: object) -> bytes:
+    """Encode a payload as UTF-8 JSON bytes for datagrams and binary headers."""
+
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return _json_encode(payload).encode("utf-8")
+
 
 class SkeletonTransport:
     """Interface for sending skeleton data to a consumer."""
@@ -25,15 +51,83 @@ class SkeletonTransport:
         """Send a skeleton sample."""
         raise NotImplementedError
 
+    async def send_batch(self, skeletons: Sequence[SkeletonData]) -> None:
+        """Send several samples; transports that can frame them together override this."""
+        for skeleton in skeletons:
+            await self.send(skeleton)
+
+    async def send_raw(self, payload: bytes) -> None:
+        """Send a frame that was already encoded as UTF-8 JSON."""
+        raise NotImplementedError
+
     async def close(self) -> None:
         """Close the transport."""
 
 
+def _batch_payload(skeletons: Sequence[SkeletonData]) -> dict:
+    return {"_frames": [skeleton.to_dict() for skeleton in skeletons]}
+
+
+def _binary_frame(skeleton: SkeletonData) -> bytes:
+    """Pack ``[u32 LE header length][JSON header][float16 xyz per joint]``.
+
+    Experimental: ``PoseReceiver.cs`` only parses JSON samples; it logs a warning and drops these frames.
+    The header uses the ``to_dict`` keys (``_timestamp``, ``_joints`` with ``_name`` entries in
+    body order, ``Meta`` when present); rotations and confidences are not part of the layout.
+    """
+
+    header, flat = _binary_parts(skeleton)
+    body = _half_floats(len(flat)).pack(*flat)
+    return b"".join((len(header).to_bytes(4, "little"), header, body))
+
+
+def _pack_binary_frame(skeleton: SkeletonData, buffer: bytearray) -> int:
+    """Write the ``_binary_frame`` layout into ``buffer`` and return the number of bytes used."""
+
+    header, flat = _binary_parts(skeleton)
+    header_end = 4 + len(header)
+    packer = _half_floats(len(flat))
+    if header_end + packer.size > len(buffer):
+        raise ValueError(f"Binary skeleton frame needs {header_end + packer.size} bytes; buffer holds {len(buffer)}")
+    _FRAME_LENGTH.pack_into(buffer, 0, len(header))
+    buffer[4:header_end] = header
+    packer.pack_into(buffer, header_end, *flat)
+    return header_end + packer.size
+
+
+def _binary_parts(skeleton: SkeletonData) -> Tuple[bytes, List[float]]:
+    joints = list(skeleton.joints.values())
+    header_payload = {"_timestamp": skeleton.timestamp_ms, "_joints": [{"_name": joint.name} for joint in joints]}
+    if skeleton.metadata:
+        header_payload["Meta"] = skeleton.metadata
+    header = _encode_bytes(header_payload)
+    flat: List[float] = []
+    for joint in joints:
+        position = joint.position or ()
+        if len(position) >= 3:
+            flat.extend(position[:3])
+        else:
+            flat.extend(list(position) + [0.0] * (3 - len(position)))
+    return header, flat
+
+
+_FRAME_LENGTH = struct.Struct("<I")
+
+
+@functools.lru_cache(maxsize=8)
+def _half_floats(count: int) -> struct.Struct:
+    # Joint counts are fixed per provider, so this compiles one format per skeleton shape.
+    return struct.Struct(f"<{count}e")
+
+
 @dataclass
 class WebSocketSkeletonTransport(SkeletonTransport):
     """Expose a WebSocket server that Unity clients can subscribe to."""
 
     uri: str
+    # Experimental: send binary float16 messages (see ``_binary_frame``) instead of JSON text.
+    # Only ``send`` honours it. PoseReceiver.cs cannot parse binary frames; it logs a warning and drops them.
+    binary: bool = False
     _server: Optional["websockets.server.Serve"] = field(default=None, init=False, repr=False)
     _connection: Optional["websockets.WebSocketServerProtocol"] = field(default=None, init=False, repr=False)
     _connection_event: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
@@ -50,7 +144,11 @@ class WebSocketSkeletonTransport(SkeletonTransport):
             except UnicodeDecodeError:
                 LOGGER.debug("Failed to decode raw path bytes; defaulting to root")
                 return None
-        parsed_path = urlparse(str(path)).path or "/"
+        path = str(path)
+        if path.startswith("/") and not path.startswith("//") and ";" not in path:
+            # Origin-form targets (what clients send) need no full URL parse: drop query/fragment.
+            return path.split("?", 1)[0].split("#", 1)[0].rstrip("/") or None
+        parsed_path = urlparse(path).path or "/"
         if not parsed_path.startswith("/"):
             parsed_path = f"/{parsed_path}"
         parsed_path = parsed_path.rstrip("/")
@@ -120,17 +218,46 @@ class WebSocketSkeletonTransport(SkeletonTransport):
                 self._connection_event.clear()
 
         LOGGER.info("Starting WebSocket server on %s:%d%s", host, port, self._path or "")
-        self._server = await websockets.serve(handler, host, port)
+        # Frames are small and sent at camera rate: per-message deflate would cost CPU on every send
+        # for little saving. Inbound limits stay at their defaults since clients are never read.
+        self._server = await websockets.serve(handler, host, port, compression=None)
 
     async def send(self, skeleton: SkeletonData) -> None:
         if self._connection is None:
             LOGGER.debug("No WebSocket client connected; dropping frame")
             return
 
-        payload = json.dumps(skeleton.to_dict())
+        if self.binary:
+            if await self._send_payload(_binary_frame(skeleton)):
+                LOGGER.debug("Sent binary skeleton frame (%d joints) via WebSocket", len(skeleton.joints))
+            return
+
+        payload = _encode_text(skeleton.to_dict())
+        if await self._send_payload(payload):
+            LOGGER.debug("Sent skeleton frame (%d joints) via WebSocket", len(skeleton.joints))
+
+    async def send_batch(self, skeletons: Sequence[SkeletonData]) -> None:
+        if self._connection is None:
+            LOGGER.debug("No WebSocket client connected; dropping %d frames", len(skeletons))
+            return
+
+        payload = _encode_text(_batch_payload(skeletons))
+        if await self._send_payload(payload):
+            LOGGER.debug("Sent %d skeleton frames in one WebSocket message", len(skeletons))
+
+    async def send_raw(self, payload: bytes) -> None:
+        if self._connection is None:
+            LOGGER.debug("No WebSocket client connected; dropping frame")
+            return
+
+        # Goes out as a binary message; the Unity receiver decodes text and binary frames alike.
+        if await self._send_payload(payload):
+            LOGGER.debug("Sent pre-encoded skeleton frame (%d bytes) via WebSocket", len(payload))
+
+    async def _send_payload(self, payload: Union[str, bytes]) -> bool:
         try:
             await self._connection.send(payload)
-            LOGGER.debug("Sent skeleton frame (%d joints) via WebSocket", len(skeleton.joints))
+            return True
         except AttributeError as exc:
             LOGGER.warning("WebSocket connection missing send() method: %s", exc)
             self._connection = None
@@ -139,6 +266,7 @@ class WebSocketSkeletonTransport(SkeletonTransport):
             LOGGER.warning("Failed to send skeleton frame via WebSocket: %s", exc)
             self._connection = None
             self._connection_event.clear()
+        return False
 
     async def close(self) -> None:
         if self._connection:
@@ -167,6 +295,9 @@ class WebSocketSkeletonTransport(SkeletonTransport):
         self._server = None
 
 
+_MAX_DATAGRAM = 65507
+
+
 @dataclass
 class UDPSkeletonTransport(SkeletonTransport):
     """Send skeleton data to a UDP socket."""
@@ -174,22 +305,57 @@ class UDPSkeletonTransport(SkeletonTransport):
     host: str
     port: int
     loop: Optional[asyncio.AbstractEventLoop] = None
+    # Experimental: send binary float16 datagrams (see ``_binary_frame``) instead of JSON text.
+    # Only ``send`` honours it. PoseReceiver.cs cannot parse binary frames; it logs a warning and drops them.
+    binary: bool = False
     _socket: Optional[socket.socket] = None
+    _addr: Optional[tuple] = field(default=None, init=False, repr=False)
+    # Reused for binary frames; sized for the largest possible UDP payload.
+    _buffer: bytearray = field(default_factory=lambda: bytearray(_MAX_DATAGRAM), init=False, repr=False)
 
     async def connect(self) -> None:
         LOGGER.info("Preparing UDP socket to %s:%d", self.host, self.port)
+        self.loop = self.loop or asyncio.get_running_loop()
+        # Resolve once so sends do not look the host name up again on every datagram.
+        infos = await self.loop.getaddrinfo(self.host, self.port, family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        self._addr = infos[0][4]
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._socket.setblocking(False)
-        self.loop = self.loop or asyncio.get_running_loop()
 
     async def send(self, skeleton: SkeletonData) -> None:
         if self._socket is None:
             raise RuntimeError("Transport is not connected")
-        payload = json.dumps(skeleton.to_dict()).encode("utf-8")
-        assert self.loop is not None
-        await self.loop.sock_sendto(self._socket, payload, (self.host, self.port))
+        if self.binary:
+            size = _pack_binary_frame(skeleton, self._buffer)
+            with memoryview(self._buffer) as view:
+                await self._sendto(view[:size])
+        else:
+            await self._sendto(_encode_bytes(skeleton.to_dict()))
         LOGGER.debug("Sent skeleton frame (%d joints) via UDP", len(skeleton.joints))
 
+    async def send_batch(self, skeletons: Sequence[SkeletonData]) -> None:
+        if self._socket is None:
+            raise RuntimeError("Transport is not connected")
+        payload = _encode_bytes(_batch_payload(skeletons))
+        await self._sendto(payload)
+        LOGGER.debug("Sent %d skeleton frames in one UDP datagram", len(skeletons))
+
+    async def send_raw(self, payload: bytes) -> None:
+        if self._socket is None:
+            raise RuntimeError("Transport is not connected")
+        await self._sendto(payload)
+        LOGGER.debug("Sent pre-encoded skeleton frame (%d bytes) via UDP", len(payload))
+
+    async def _sendto(self, payload: Union[bytes, memoryview]) -> None:
+        try:
+            # Datagram sends are accepted immediately unless the socket buffer is full, so skip the
+            # event loop's writer registration on the common path.
+            self._socket.sendto(payload, self._addr)
+        except BlockingIOError:
+            assert self.loop is not None
+            # Copy views of the shared buffer: the next frame may overwrite it while this one waits.
+            await self.loop.sock_sendto(self._socket, bytes(payload), self._addr)
+
     async def close(self) -> None:
         if self._socket:
             self._socket.close()
@@ -1,4 +1,7 @@
 import asyncio
+import json
+
+import pytest
 
 
 class DummyProvider:
@@ -186,3 +189,280 @@ def test_update_seating_layout_forwards_to_provider():
 
     assert provider.received is layout
 
+
+def test_run_paces_frames_against_absolute_deadlines(monkeypatch):
+    from pose_capture import pose_capture_app
+    from pose_capture.pose_capture_app import CaptureConfig, PoseCaptureApp
+
+    clock = [100.0]
+    delays = []
+
+    class SlowProvider(DummyProvider):
+        def get_latest(self):
+            clock[0] += 0.004  # simulated capture + inference time
+            return None
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        clock[0] += delay
+        if len(delays) == 4:
+            app._running = False
+
+    monkeypatch.setattr(pose_capture_app.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(pose_capture_app.asyncio, "sleep", fake_sleep)
+
+    config = CaptureConfig(provider=SlowProvider(), transport=DummyTransport(), frame_interval=0.01)
+    app = PoseCaptureApp(config)
+    app._running = True
+    asyncio.run(app.run())
+
+    assert delays == [pytest.approx(0.006)] * 4
+
+
+def test_run_drops_frames_while_send_in_flight():
+    from pose_capture.pose_capture_app import CaptureConfig, PoseCaptureApp
+    from pose_capture.providers import SkeletonData
+
+    class CountingProvider(DummyProvider):
+        calls = 0
+
+        def get_latest(self):
+            self.calls += 1
+            if self.calls == 5:
+                app._running = False
+            return SkeletonData()
+
+    class StalledTransport(DummyTransport):
+        sent = 0
+
+        async def send(self, skeleton):
+            self.sent += 1
+            await asyncio.sleep(3600)
+
+    transport = StalledTransport()
+    config = CaptureConfig(provider=CountingProvider(), transport=transport, frame_interval=0)
+    app = PoseCaptureApp(config)
+    app._running = True
+    asyncio.run(app.run())
+
+    assert transport.sent == 1
+    assert app._dropped_frames == 4
+
+
+def test_load_metadata_reuses_parse_until_file_changes(tmp_path):
+    import os
+
+    from pose_capture.pose_capture_app import _load_metadata
+
+    path = tmp_path / "metadata.json"
+    path.write_text('{"venue": "a"}')
+    first = _load_metadata(path)
+    assert _load_metadata(path) is first
+
+    path.write_text('{"venue": "b"}')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _load_metadata(path) == {"venue": "b"}
+
+
+def test_run_batches_frames_when_configured():
+    from pose_capture.pose_capture_app import CaptureConfig, PoseCaptureApp
+    from pose_capture.providers import SkeletonData
+
+    class CountingProvider(DummyProvider):
+        calls = 0
+
+        def get_latest(self):
+            self.calls += 1
+            if self.calls == 6:
+                app._running = False
+            return SkeletonData(timestamp_ms=self.calls)
+
+    class RecordingTransport(DummyTransport):
+        def __init__(self):
+            self.batches = []
+
+        async def send_batch(self, skeletons):
+            self.batches.append([skeleton.timestamp_ms for skeleton in skeletons])
+
+    transport = RecordingTransport()
+    config = CaptureConfig(provider=CountingProvider(), transport=transport, frame_interval=0, send_batch_size=3)
+    app = PoseCaptureApp(config)
+    app._running = True
+    asyncio.run(app.run())
+
+    assert transport.batches == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_frames_keep_batching_while_a_batch_send_is_in_flight():
+    from pose_capture.pose_capture_app import CaptureConfig, PoseCaptureApp
+    from pose_capture.providers import SkeletonData
+
+    class GatedTransport(DummyTransport):
+        def __init__(self):
+            self.batches = []
+            self.gate = None
+
+        async def send_batch(self, skeletons):
+            self.batches.append([skeleton.timestamp_ms for skeleton in skeletons])
+            await self.gate.wait()
+
+    transport = GatedTransport()
+    config = CaptureConfig(provider=DummyProvider(), transport=transport, send_batch_size=2)
+    app = PoseCaptureApp(config)
+
+    async def scenario():
+        transport.gate = asyncio.Event()
+        for timestamp in range(1, 3):
+            app._dispatch(SkeletonData(timestamp_ms=timestamp))
+        await asyncio.sleep(0)
+        for timestamp in range(3, 6):
+            app._dispatch(SkeletonData(timestamp_ms=timestamp))
+        transport.gate.set()
+        await asyncio.sleep(0)
+        app._dispatch(SkeletonData(timestamp_ms=6))
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+
+    assert transport.batches == [[1, 2], [4, 5]]
+    assert [frame.timestamp_ms for frame in app._batch] == [6]
+    assert app._dropped_frames == 1
+
+
+def test_partial_batch_flushes_after_max_age_when_provider_stalls():
+    from pose_capture.pose_capture_app import CaptureConfig, PoseCaptureApp
+    from pose_capture.providers import SkeletonData
+
+    class StallingProvider(DummyProvider):
+        calls = 0
+
+        def get_latest(self):
+            self.calls += 1
+            if self.calls <= 2:
+                return SkeletonData(timestamp_ms=self.calls)
+            if self.calls >= 40:
+                app._running = False
+            return None
+
+    class RecordingTransport(DummyTransport):
+        def __init__(self):
+            self.batches = []
+
+        async def send_batch(self, skeletons):
+            self.batches.append(([skeleton.timestamp_ms for skeleton in skeletons], app._running))
+
+    transport = RecordingTransport()
+    config = CaptureConfig(
+        provider=StallingProvider(),
+        transport=transport,
+        frame_interval=0.005,
+        send_batch_size=10,
+        send_batch_max_ms=20,
+    )
+    app = PoseCaptureApp(config)
+    app._running = True
+    asyncio.run(app.run())
+
+    # Sent by the deadline timer while still running, not by the flush in stop().
+    assert transport.batches == [([1, 2], True)]
+
+
+def test_run_sends_pre_encoded_frames_when_enabled():
+    from pose_capture.pose_capture_app import CaptureConfig, PoseCaptureApp
+    from pose_capture.providers import Joint, SkeletonData
+    from pose_capture.transports import SkeletonTransport
+
+    class OneShotProvider(DummyProvider):
+        def get_latest(self):
+            app._running = False
+            return SkeletonData(timestamp_ms=7, joints={"Hips": Joint(name="Hips", position=(1.0, 2.0, 3.0))})
+
+    class RawTransport(SkeletonTransport):
+        def __init__(self):
+            self.raw = []
+
+        async def send(self, skeleton):  # pragma: no cover - must not be used
+            raise AssertionError("send() should be bypassed")
+
+        async def send_raw(self, payload):
+            self.raw.append(payload)
+
+    transport = RawTransport()
+    config = CaptureConfig(provider=OneShotProvider(), transport=transport, frame_interval=0, mode="", emit_bytes=True)
+    app = PoseCaptureApp(config)
+    asyncio.run(app.run())
+
+    assert len(transport.raw) == 1
+    assert isinstance(transport.raw[0], bytes)
+    payload = json.loads(transport.raw[0])
+    assert payload["_timestamp"] == 7
+    assert payload["_joints"][0]["_position"] == {"x": 1.0, "y": 2.0, "z": 3.0}
+
+
+def test_batched_frames_use_send_raw_when_emit_bytes_is_set():
+    from pose_capture.pose_capture_app import CaptureConfig, PoseCaptureApp
+    from pose_capture.providers import SkeletonData
+    from pose_capture.transports import SkeletonTransport
+
+    class CountingProvider(DummyProvider):
+        calls = 0
+
+        def get_latest(self):
+            self.calls += 1
+            if self.calls == 4:
+                app._running = False
+            return SkeletonData(timestamp_ms=self.calls)
+
+    class RawTransport(SkeletonTransport):
+        def __init__(self):
+            self.raw = []
+
+        async def send_batch(self, skeletons):  # pragma: no cover - must not be used
+            raise AssertionError("send_batch() should be bypassed")
+
+        async def send_raw(self, payload):
+            self.raw.append(payload)
+
+    transport = RawTransport()
+    config = CaptureConfig(
+        provider=CountingProvider(), transport=transport, frame_interval=0, send_batch_size=2, emit_bytes=True
+    )
+    app = PoseCaptureApp(config)
+
+    async def scenario():
+        await app.run()
+        await app.stop()
+
+    asyncio.run(scenario())
+
+    frames = [[frame["_timestamp"] for frame in json.loads(raw)["_frames"]] for raw in transport.raw]
+    assert frames == [[1, 2], [3, 4]]
+
+
+def test_reuse_tagged_seating_reaches_file_and_editor_layouts(tmp_path):
+    from pose_capture.pose_capture_app import CaptureConfig, PoseCaptureApp, _load_seating
+    from pose_capture.seating import SeatRegion, SeatingLayout
+
+    path = tmp_path / "seating.json"
+    path.write_text('{"seats": [{"id": "a", "bounds": {"xMin": 0.0, "xMax": 1.0, "yMin": 0.0, "yMax": 1.0}}]}')
+    assert _load_seating(path, reuse_tagged_results=True).reuse_tagged_results
+    assert not _load_seating(path).reuse_tagged_results
+
+    config = CaptureConfig(provider=DummyProvider(), transport=DummyTransport(), reuse_tagged_seating=True)
+    app = PoseCaptureApp(config)
+    edited = SeatingLayout([SeatRegion("b", 0.0, 0.0, 0.5, 0.5)])
+    asyncio.run(app.update_seating_layout(edited))
+    assert app._seating_layout.reuse_tagged_results
+    assert app._seating_layout.fingerprint == edited.fingerprint
+
+
+def test_binary_frames_reject_batching_and_pre_encoded_sends():
+    import argparse
+
+    from pose_capture.pose_capture_app import build_config_from_args
+
+    for overrides in ({"send_batch_size": 4}, {"emit_bytes": True}):
+        args = argparse.Namespace(**{"binary_frames": True, "send_batch_size": 1, "emit_bytes": False, **overrides})
+        with pytest.raises(ValueError, match="--binary-frames"):
+            build_config_from_args(args)
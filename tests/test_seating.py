@@ -71,3 +71,102 @@ def test_layout_from_mapping_validation():
 
     with pytest.raises(ValueError):
         SeatingLayout.from_mapping({"seats": [{"id": "s1"}]})
+
+
+def test_layout_from_json_round_trip(tmp_path):
+    path = tmp_path / "layout.json"
+    path.write_text(
+        '{"seats": [{"id": "s1", "bounds": {"xMin": 0.1, "xMax": 0.4, "yMin": 0.2, "yMax": 0.6}}]}',
+        encoding="utf-8",
+    )
+    layout = SeatingLayout.from_json(path)
+    assert [seat.seat_id for seat in layout.seats] == ["s1"]
+    assert layout.seats[0].x_max == pytest.approx(0.4)
+
+    empty = tmp_path / "empty.json"
+    empty.write_text("")
+    with pytest.raises(ValueError):
+        SeatingLayout.from_json(empty)
+
+
+def test_grid_resolve_matches_linear_scan():
+    import random
+
+    rng = random.Random(7)
+    seats = []
+    for index in range(40):
+        x_min = rng.uniform(-0.2, 0.9)
+        y_min = rng.uniform(-0.2, 0.9)
+        seats.append(SeatRegion(f"s{index}", x_min, y_min, x_min + rng.uniform(0.01, 0.4), y_min + rng.uniform(0.01, 0.4)))
+    layout = SeatingLayout(seats)
+
+    points = [(rng.uniform(-0.3, 1.3), rng.uniform(-0.3, 1.3)) for _ in range(2000)]
+    points += [(seat.x_min, seat.y_max) for seat in seats] + [(float("nan"), 0.5), (float("inf"), 0.5)]
+    for x, y in points:
+        expected = next((seat for seat in seats if seat.contains(x, y)), None)
+        assert layout.resolve(x, y) is expected
+
+
+def test_confidence_falls_off_towards_seat_edges():
+    layout = SeatingLayout([SeatRegion("s", 0.2, 0.2, 0.6, 0.6)])
+
+    def confidence(x, y):
+        return layout.evaluate(build_skeleton(x, y))["confidence"]
+
+    assert confidence(0.4, 0.4) == pytest.approx(1.0)
+    assert confidence(0.3, 0.4) == pytest.approx(0.5)
+    assert confidence(0.4, 0.58) == pytest.approx(0.1)
+    assert confidence(0.2, 0.4) == 0.0
+    assert confidence(0.7, 0.4) == 0.0
+    assert layout.evaluate(build_skeleton(0.7, 0.4))["activeSeatId"] is None
+
+
+def test_seats_payload_reused_while_active_seat_is_unchanged():
+    layout = SeatingLayout([SeatRegion("a", 0.0, 0.0, 0.5, 1.0), SeatRegion("b", 0.5, 0.0, 1.0, 1.0)])
+
+    first = layout.evaluate(build_skeleton(0.2, 0.5))
+    second = layout.evaluate(build_skeleton(0.1, 0.5))
+    assert second["seats"] is first["seats"]
+    assert second["confidence"] != first["confidence"]
+
+    moved = layout.evaluate(build_skeleton(0.8, 0.5))
+    assert moved["activeSeatId"] == "b"
+    assert [seat["occupied"] for seat in moved["seats"]] == [False, True]
+    assert [seat["occupied"] for seat in first["seats"]] == [True, False]
+
+
+def test_evaluate_cache_hits_return_the_identical_shared_result():
+    layout = SeatingLayout([SeatRegion("a", 0.0, 0.0, 0.5, 1.0), SeatRegion("b", 0.5, 0.0, 1.0, 1.0)])
+
+    first = layout.evaluate(build_skeleton(0.25, 0.5))
+    # Cache hits hand back the very same dict (and seats list); callers must not mutate it.
+    hit = layout.evaluate(build_skeleton(0.25 + 1e-5, 0.5))
+    assert hit is first
+    assert hit["seats"] is first["seats"]
+    same_seat = layout.evaluate(build_skeleton(0.3, 0.5))
+    assert same_seat is not first
+    assert same_seat["seats"] is first["seats"]
+    moved = layout.evaluate(build_skeleton(0.75, 0.5))
+    assert moved is not first
+    assert moved["activeSeatId"] == "b"
+    assert moved["seats"] is not first["seats"]
+
+
+def test_tagged_upstream_results_are_reused_only_when_enabled():
+    seats = [SeatRegion("a", 0.0, 0.0, 0.5, 1.0), SeatRegion("b", 0.5, 0.0, 1.0, 1.0)]
+    trusting = SeatingLayout(seats, reuse_tagged_results=True)
+    strict = SeatingLayout(seats)
+    assert trusting.fingerprint == strict.fingerprint
+    assert SeatingLayout(seats[:1]).fingerprint != strict.fingerprint
+
+    skeleton = build_skeleton(0.75, 0.5)
+    upstream = {"activeSeatId": "a", "confidence": 1.0, "seats": [], "_layout": strict.fingerprint}
+    skeleton.metadata["seating"] = upstream
+    assert trusting.evaluate(skeleton) is upstream
+
+    recomputed = strict.evaluate(skeleton)
+    assert recomputed["activeSeatId"] == "b"
+    assert recomputed["_layout"] == strict.fingerprint
+
+    upstream["_layout"] = "stale"
+    assert trusting.evaluate(skeleton)["activeSeatId"] == "b"
@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, payload):
+        self.messages.append(payload)
+
+    async def close(self, code=1000, reason=""):
+        pass
+
+
+def test_binary_frame_layout():
+    import struct
+
+    from pose_capture.providers import Joint, SkeletonData
+    from pose_capture.transports import WebSocketSkeletonTransport
+
+    skeleton = SkeletonData(timestamp_ms=5, metadata={"mode": "shadow"})
+    skeleton.joints["Hips"] = Joint(name="Hips", position=[0.5, -1.25, 2.0])
+    skeleton.joints["Head"] = Joint(name="Head", position=[0.25, 1.5])
+
+    async def scenario():
+        transport = WebSocketSkeletonTransport("ws://127.0.0.1:9999", binary=True)
+        connection = RecordingConnection()
+        transport._connection = connection
+        await transport.send(skeleton)
+        return connection.messages
+
+    (frame,) = asyncio.run(scenario())
+    header_length = int.from_bytes(frame[:4], "little")
+    header = json.loads(frame[4 : 4 + header_length])
+    assert header == {"_timestamp": 5, "_joints": [{"_name": "Hips"}, {"_name": "Head"}], "Meta": {"mode": "shadow"}}
+    assert struct.unpack("<6e", frame[4 + header_length :]) == (0.5, -1.25, 2.0, 0.25, 1.5, 0.0)
+
+
+def test_normalize_path_fast_path_matches_urlparse():
+    from urllib.parse import urlparse
+
+    from pose_capture.transports import WebSocketSkeletonTransport
+
+    def reference(path):
+        parsed = urlparse(path).path or "/"
+        if not parsed.startswith("/"):
+            parsed = f"/{parsed}"
+        parsed = parsed.rstrip("/") or "/"
+        return parsed if parsed != "/" else None
+
+    for path in ["/", "/pose", "/pose/", "/pose?x=1", "/pose#frag", "/a/b//", "/?q=/x", "/p;v=1", "//host/p", "pose", "ws://h:1/pose/"]:
+        assert WebSocketSkeletonTransport._normalize_path(path) == reference(path), path
+    assert WebSocketSkeletonTransport._normalize_path(b"/pose?x=1") == "/pose"
+    assert WebSocketSkeletonTransport._normalize_path(None) is None
+
+
+def test_udp_transport_sends_datagrams_to_resolved_address():
+    import socket
+
+    from pose_capture.providers import SkeletonData
+    from pose_capture.transports import UDPSkeletonTransport
+
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(1.0)
+
+    async def scenario():
+        transport = UDPSkeletonTransport("localhost", receiver.getsockname()[1])
+        await transport.connect()
+        await transport.send(SkeletonData(timestamp_ms=9))
+        await transport.send_raw(b'{"raw":true}')
+        await transport.close()
+
+    try:
+        asyncio.run(scenario())
+        assert json.loads(receiver.recv(65535))["_timestamp"] == 9
+        assert receiver.recv(65535) == b'{"raw":true}'
+    finally:
+        receiver.close()
+
+
+def test_udp_binary_frames_match_websocket_layout():
+    import socket
+
+    from pose_capture.providers import Joint, SkeletonData
+    from pose_capture.transports import UDPSkeletonTransport, _binary_frame
+
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(1.0)
+    first = SkeletonData(timestamp_ms=1, metadata={"mode": "shadow", "note": "a much longer header value"})
+    first.joints["Hips"] = Joint(name="Hips", position=[0.5, 1.0, 1.5])
+    second = SkeletonData(timestamp_ms=2)
+    second.joints["Hips"] = Joint(name="Hips", position=[0.25, 0.5, 0.75])
+
+    async def scenario():
+        transport = UDPSkeletonTransport("127.0.0.1", receiver.getsockname()[1], binary=True)
+        await transport.connect()
+        await transport.send(first)
+        await transport.send(second)
+        await transport.close()
+
+    try:
+        asyncio.run(scenario())
+        assert receiver.recv(65535) == _binary_frame(first)
+        assert receiver.recv(65535) == _binary_frame(second)
+    finally:
+        receiver.close()